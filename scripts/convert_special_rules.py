@@ -5,41 +5,164 @@ Faction-level specialRules remain as objects with name and description.
 """
 
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# orjson is ~5x faster than stdlib json for parse and serialize;
+# fall back to stdlib if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson lets us stream large files one unit at a time instead of
+# materializing the whole document; optional like orjson
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Above this size, stream the file unit-by-unit rather than loading it
+# whole (peak memory O(one unit) instead of O(file))
+STREAM_THRESHOLD = 8 * 1024 * 1024
+
+def convert_unit_rules(unit):
+    """Convert one unit's specialRules from objects to strings in place.
+
+    Returns True if anything was mutated.
+    """
+    changed = False
+    rules = unit.get('specialRules')
+    if rules:
+        # Fast path: extractor output is either all-objects or
+        # all-strings, so a str first element means already converted
+        if type(rules[0]) is str:
+            return False
+        # Convert from [{"name": "rule"}] to ["rule"] in place,
+        # avoiding a new list when rules are already strings.
+        # Bind dict to a local so the hot loop uses LOAD_FAST instead
+        # of a global lookup per element.
+        _dict = dict
+        for i, rule in enumerate(rules):
+            if type(rule) is _dict:
+                rules[i] = rule['name']
+                changed = True
+    return changed
+
 def convert_special_rules(data):
-    """Convert unit specialRules from objects to strings."""
+    """Convert unit specialRules from objects to strings.
+
+    Returns (data, changed) so callers can skip rewriting files that
+    are already converted.
+    """
+    changed = False
     if 'units' in data:
         for unit in data['units']:
-            if 'specialRules' in unit and unit['specialRules']:
-                # Convert from [{"name": "rule"}] to ["rule"]
-                unit['specialRules'] = [
-                    rule['name'] if isinstance(rule, dict) else rule
-                    for rule in unit['specialRules']
-                ]
-    return data
+            if convert_unit_rules(unit):
+                changed = True
+    return data, changed
 
-def main():
-    # Get all faction JSON files
-    factions_dir = Path(__file__).parent.parent / 'src' / 'data' / 'factions'
+def stream_convert_file(json_file):
+    """Convert a faction file with ijson, one unit in memory at a time.
 
-    for json_file in factions_dir.glob('*.json'):
-        print(f"Processing {json_file.name}...")
+    Streams units[] and re-emits the document incrementally, so peak
+    memory stays O(one unit) for multi-MB faction files. The schema's
+    top level is exactly {faction, units}; faction metadata is tiny and
+    read up front.
+    """
+    # use_float makes ijson yield native floats instead of Decimal,
+    # which json.dumps can't serialize
+    with open(json_file, 'rb') as f:
+        faction = next(ijson.items(f, 'faction', use_float=True), None)
 
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    tmp = json_file.with_suffix('.json.tmp')
+    changed = False
+    try:
+        with open(json_file, 'rb') as src, open(tmp, 'wb', buffering=65536) as dst:
+            dst.write(b'{\n')
+            if faction is not None:
+                block = json.dumps(faction, indent=2, ensure_ascii=False)
+                dst.write(f'  "faction": {block.replace(chr(10), chr(10) + "  ")},\n'.encode('utf-8'))
+            dst.write(b'  "units": [\n')
+            first = True
+            for unit in ijson.items(src, 'units.item', use_float=True):
+                if convert_unit_rules(unit):
+                    changed = True
+                if not first:
+                    dst.write(b',\n')
+                first = False
+                block = json.dumps(unit, indent=2, ensure_ascii=False)
+                dst.write(('    ' + block.replace('\n', '\n    ')).encode('utf-8'))
+            dst.write(b'\n  ]\n}')
+    except BaseException:
+        # Don't leave a partial .tmp behind if the re-emit fails midway
+        tmp.unlink(missing_ok=True)
+        raise
 
-        # Convert special rules
-        data = convert_special_rules(data)
+    if changed:
+        tmp.replace(json_file)
+    else:
+        tmp.unlink()
+    return json_file.name, changed
 
-        # Write back
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+def process_file(json_file):
+    """Read, convert, and write back a single faction JSON file."""
+    # Large files: stream instead of materializing the whole document
+    if ijson is not None and json_file.stat().st_size > STREAM_THRESHOLD:
+        return stream_convert_file(json_file)
+
+    if orjson is not None:
+        data = orjson.loads(json_file.read_bytes())
+    else:
+        # Binary mode with a 64 KB buffer avoids the small-chunk reads
+        # of the default 8 KB text-mode buffer
+        with open(json_file, 'rb', buffering=65536) as f:
+            data = json.loads(f.read())
+
+    # Convert special rules
+    data, changed = convert_special_rules(data)
+
+    # Nothing mutated - skip the serialize and the disk write
+    if not changed:
+        return json_file.name, False
+
+    # Write back in a single write call (json.dump issues one small
+    # write per token, which is much slower on large faction files).
+    # Write to a tempfile and rename so a crash mid-write can't leave a
+    # truncated faction file behind.
+    tmp = json_file.with_suffix('.json.tmp')
+    if orjson is not None:
+        tmp.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(tmp, 'wb', buffering=65536) as f:
+            f.write(payload)
+    os.replace(tmp, json_file)
+
+    return json_file.name, True
+
+def main():
+    # Get all faction JSON files - scandir gives us the listing in one
+    # pass without pathlib's per-file stat overhead
+    factions_dir = Path(__file__).parent.parent / 'src' / 'data' / 'factions'
+    with os.scandir(factions_dir) as it:
+        json_files = [Path(entry.path) for entry in it if entry.name.endswith('.json')]
 
-        print(f"  ✓ Updated {json_file.name}")
+    # Each file is independent, so convert them across all cores.
+    # Buffer the status lines and emit them in one write at the end
+    # rather than one locked/flushed print per file.
+    status_lines = []
+    with ProcessPoolExecutor() as executor:
+        for name, updated in executor.map(process_file, json_files):
+            if updated:
+                status_lines.append(f"  ✓ Updated {name}")
+            else:
+                status_lines.append(f"  - {name} already converted, skipped")
 
-    print("\n✓ All faction files updated!")
+    status_lines.append("\n✓ All faction files updated!")
+    sys.stdout.write('\n'.join(status_lines) + '\n')
 
 if __name__ == '__main__':
     main()
@@ -2,61 +2,103 @@
 """
 Debug script to examine specific pages with OCR issues
 """
+from __future__ import annotations
+
+import re
 import sys
-from pdf2image import convert_from_path
-import pytesseract
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
 
-def debug_page(pdf_path: str, page_num: int):
-    """Extract and show raw OCR output for a specific page"""
-    print(f"\n{'='*80}")
-    print(f"DEBUG: Page {page_num}")
-    print(f"{'='*80}")
+# pdf2image, pytesseract, and PIL are imported lazily inside the
+# functions that need them - they pull in plugin/subprocess machinery
+# that makes even --help style invocations slow
 
-    # Convert single page to image at high DPI
-    images = convert_from_path(
-        pdf_path,
-        first_page=page_num,
-        last_page=page_num,
-        dpi=300
-    )
+# R followed by anything up to a quote, e.g. R40" - Tesseract tokens are
+# already whitespace-split, so no strip needed before matching
+RANGE_WORD_RE = re.compile(r'^R\S*"')
 
-    if not images:
-        print(f"ERROR: Could not convert page {page_num}")
-        return
+def ocr_image(image) -> str:
+    """Run OCR on a page image, returning the raw TSV output"""
+    import pytesseract
 
-    image = images[0]
+    # Grayscale cuts the bytes fed to Tesseract by 3x with no accuracy
+    # loss on printed pages (matches extractor_ocr.py)
+    if image.mode != 'L':
+        image = image.convert('L')
 
-    # Get OCR data with position info
-    data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
+    # Single pass - word and line output are both reconstructed from this.
+    # Raw TSV instead of Output.DICT: the DICT path allocates six
+    # parallel lists of Python ints/strings per page, while we only
+    # need a few columns.
+    # --oem 1 --psm 6: LSTM-only engine, single uniform text block
+    # (same config as extractor_ocr.py)
+    return pytesseract.image_to_data(image, config=r'--oem 1 --psm 6')
 
-    # Extract words and show any with 'R' followed by range-like patterns
-    print("\nWords containing range patterns:")
-    for i in range(len(data['text'])):
-        text = data['text'][i].strip()
+def debug_page(page_num: int, tsv: str):
+    """Show raw OCR output for a page from its image_to_data TSV"""
+    print(f"\n{'='*80}")
+    print(f"DEBUG: Page {page_num}")
+    print(f"{'='*80}")
+
+    # One streaming pass over the TSV rows collects both the
+    # range-pattern words and the reconstructed lines.
+    # Columns: level, page, block, par, line, word, left, top, width,
+    # height, conf, text
+    range_words = []
+    lines = {}
+    for row in tsv.splitlines()[1:]:
+        cols = row.split('\t')
+        if len(cols) < 12:
+            continue  # structural rows (level < 5) carry no text
+        text = cols[11].strip()
         if not text:
             continue
 
         # Look for R followed by digits or letters and quotes
-        if text.startswith('R') and '"' in text:
-            print(f"  Word: '{text}' [hex: {text.encode('utf-8').hex()}]")
-            print(f"    Confidence: {data['conf'][i]}")
+        if RANGE_WORD_RE.match(text):
+            range_words.append((text, cols[10]))
+
+        key = (int(cols[2]), int(cols[3]), int(cols[4]))
+        lines.setdefault(key, []).append(text)
+
+    print("\nWords containing range patterns:")
+    for text, conf in range_words:
+        print(f"  Word: '{text}' [hex: {text.encode('utf-8').hex()}]")
+        print(f"    Confidence: {conf}")
 
-    # Also get full text to see reconstructed lines
     print("\nFull OCR text output:")
-    full_text = pytesseract.image_to_string(image)
-    for line in full_text.split('\n'):
+    for key in sorted(lines):
+        line = ' '.join(lines[key])
         if 'R' in line and '"' in line:
             print(f"  {line}")
 
 def main():
+    from pdf2image import convert_from_path
+
     pdf_path = "/home/ahlakes/git/rygonet/scripts/FM 100-1-8X - THE FEDERAL STATES ARMY.pdf"
 
-    # Page 75 - KORENBLOEM
-    debug_page(pdf_path, 75)
+    # Pages 75 (KORENBLOEM) and 76 (WHEAT)
+    # Render both pages in one poppler invocation instead of one per page
+    page_nums = [75, 76]
+    # 200 DPI is plenty for printed text and renders ~2.25x fewer
+    # pixels than 300 for both poppler and Tesseract to chew through
+    images = convert_from_path(
+        pdf_path,
+        first_page=page_nums[0],
+        last_page=page_nums[-1],
+        dpi=200
+    )
+
+    if not images:
+        print("ERROR: Could not convert pages")
+        return 1
+
+    # OCR the pages concurrently - each tesseract run is its own
+    # subprocess, so the pages overlap across cores
+    with ThreadPoolExecutor(max_workers=len(images)) as executor:
+        ocr_results = list(executor.map(ocr_image, images))
 
-    # Page 76 - WHEAT
-    debug_page(pdf_path, 76)
+    for page_num, data in zip(page_nums, ocr_results):
+        debug_page(page_num, data)
 
     return 0
 
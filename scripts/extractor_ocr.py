@@ -52,9 +52,12 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -63,15 +66,28 @@ from pdf2image import convert_from_path
 from PIL import Image
 import pytesseract
 
+# Tesseract's own OpenMP threading hurts throughput at card/page crop
+# sizes, especially when we already parallelize across pages
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
 # Helper functions recreated from deleted extractor.py
+# \u201c = " (left double quote), \u201d = " (right double quote)
+# \u2018 = ' (left single quote), \u2019 = ' (right single quote)
+_QUOTE_TRANS = str.maketrans({
+    '\u201c': '"', '\u201d': '"',  # Curly double quotes -> straight
+    '\u2018': "'", '\u2019': "'",  # Curly single quotes -> straight
+})
+
+
+@functools.lru_cache(maxsize=8192)
 def norm(s: str) -> str:
-    """Normalize quotes in text - convert curly quotes to straight quotes"""
-    # Replace curly quotes with straight quotes
-    # \u201c = " (left double quote), \u201d = " (right double quote)
-    # \u2018 = ' (left single quote), \u2019 = ' (right single quote)
-    s = s.replace('\u201c', '"').replace('\u201d', '"')  # Curly double quotes -> straight
-    s = s.replace('\u2018', "'").replace('\u2019', "'")  # Curly single quotes -> straight
-    return s
+    """Normalize quotes in text - convert curly quotes to straight quotes
+
+    Cached: the same short strings (unit types, stat tokens, repeated
+    rule names) come through once per card across the whole book.
+    """
+    # One translate pass instead of four full-string replace scans
+    return s.translate(_QUOTE_TRANS)
 
 
 def clean_unit_name(name: str) -> str:
@@ -88,8 +104,16 @@ def clean_unit_name(name: str) -> str:
     return cleaned
 
 
+_SLUG_SEP_RE = re.compile(r'[^a-z0-9]+')
+
+
+@functools.lru_cache(maxsize=512)
 def slugify(s: str) -> str:
-    """Convert to URL-friendly slug"""
+    """Convert to URL-friendly slug
+
+    Cached - the same unit names recur across pages (and re-runs), and
+    the unicode normalize + regex pass isn't free.
+    """
     import unicodedata
     # Normalize unicode characters
     s = unicodedata.normalize('NFKD', s)
@@ -98,7 +122,7 @@ def slugify(s: str) -> str:
     # Convert to lowercase
     s = s.lower()
     # Replace spaces and non-alphanumeric with hyphens
-    s = re.sub(r'[^a-z0-9]+', '-', s)
+    s = _SLUG_SEP_RE.sub('-', s)
     # Remove leading/trailing hyphens
     s = s.strip('-')
     return s
@@ -106,13 +130,27 @@ def slugify(s: str) -> str:
 
 def dedupe_preserve_order(items: List[str]) -> List[str]:
     """Remove duplicates while preserving order"""
-    seen = set()
-    result = []
-    for item in items:
-        if item not in seen:
-            seen.add(item)
-            result.append(item)
-    return result
+    # dict.fromkeys does the seen-set bookkeeping at C level
+    return list(dict.fromkeys(items))
+
+
+# Fast paths for the tokens that dominate real card data - one dict
+# lookup instead of a chain of lower()/endswith()/isdigit() checks.
+# Misses fall through to the full parsers below.
+_ACC_FAST: Dict[str, Any] = {
+    'xx': 'xx', 'x': 'xx', 'XX': 'xx', 'X': 'xx', '++': '++', '*': '*',
+    **{f'{n}+': n for n in range(2, 7)},
+    **{str(n): n for n in range(10)},
+}
+_STRENGTH_FAST: Dict[str, Any] = {
+    **{str(n): n for n in range(10)},
+    **{f'{n}+': f'{n}+' for n in range(10)},
+}
+_TOUGHNESS_FAST: Dict[str, Any] = {
+    **{str(n): n for n in range(10)},
+    **{f'{n}+': f'{n}+' for n in range(7)},
+    **{f'{n}-': f'{n}-' for n in range(7)},
+}
 
 
 def parse_acc(acc: str) -> Any:
@@ -121,6 +159,10 @@ def parse_acc(acc: str) -> Any:
     if not acc:
         return None
 
+    fast = _ACC_FAST.get(acc)
+    if fast is not None:
+        return fast
+
     # Handle special cases
     if acc.lower() in ['xx', 'x']:
         return 'xx'
@@ -175,6 +217,10 @@ def parse_strength(sv: str) -> Any:
 
     sv = sv.strip()
 
+    fast = _STRENGTH_FAST.get(sv)
+    if fast is not None:
+        return fast
+
     # Handle dice notation like [D3], [D6]
     dice_match = re.match(r'^\[D(\d+)\]$', sv)
     if dice_match:
@@ -218,6 +264,10 @@ def parse_toughness_value(t: str) -> Any:
     if not t:
         return None
 
+    fast = _TOUGHNESS_FAST.get(t)
+    if fast is not None:
+        return fast
+
     # Check if it's a modifier like "1-" or "2+"
     if t.endswith('-') or t.endswith('+'):
         return t
@@ -315,6 +365,19 @@ def heading_for_card(headings: List[Tuple[str, Tuple]], card_bbox: Tuple[float,
 
     card_x0, card_top, card_x1, card_bottom = card_bbox
 
+    if np is not None and len(headings) > 1:
+        # Vectorized: one bbox array, one boolean mask, one argmin,
+        # instead of per-heading Python float arithmetic per card
+        boxes = np.array([h[1] for h in headings], dtype=np.float64)
+        eligible = (boxes[:, 3] <= card_top) & (
+            np.minimum(card_x1, boxes[:, 2]) - np.maximum(card_x0, boxes[:, 0]) > 0
+        )
+        if not eligible.any():
+            return ""
+        distance = np.where(eligible, card_top - boxes[:, 3], np.inf)
+        # argmin keeps the first of equal distances, matching the loop
+        return headings[int(distance.argmin())][0]
+
     # Find the closest heading above this card
     best_heading = ""
     best_distance = float('inf')
@@ -336,8 +399,42 @@ def heading_for_card(headings: List[Tuple[str, Tuple]], card_bbox: Tuple[float,
     return best_heading
 
 
+# Comma not inside parentheses - [^()]* can't cross a bracket, so a
+# comma whose lookahead reaches ')' without passing '(' is in-parens
+_RULE_SPLIT_RE = re.compile(r',(?![^()]*\))')
+
+
 def split_rules_smart(line: str) -> List[str]:
     """Split rules by comma, but respect parentheses"""
+    # The lookahead is only equivalent to depth tracking for flat,
+    # well-formed parens. Fall back to the explicit depth-tracking scan
+    # when the depth goes negative (a close before its open, e.g. a
+    # truncated '3), Smoke (1"'), ends nonzero (unbalanced), or exceeds
+    # one (a nested open defeats the lookahead for commas inside the
+    # outer parens). Lines without parens - the common case - skip the
+    # scan on a substring check.
+    if ')' in line:
+        depth = 0
+        for char in line:
+            if char == '(':
+                depth += 1
+                if depth > 1:
+                    return _split_rules_paren_depth(line)
+            elif char == ')':
+                depth -= 1
+                if depth < 0:
+                    return _split_rules_paren_depth(line)
+        if depth:
+            return _split_rules_paren_depth(line)
+    elif '(' in line:
+        # Opens with no close at all are unbalanced
+        return _split_rules_paren_depth(line)
+
+    return [rule for part in _RULE_SPLIT_RE.split(line) if (rule := part.strip())]
+
+
+def _split_rules_paren_depth(line: str) -> List[str]:
+    """Char-by-char splitter with explicit paren-depth tracking"""
     rules = []
     current = []
     paren_depth = 0
@@ -366,6 +463,33 @@ def split_rules_smart(line: str) -> List[str]:
     return rules
 
 
+# Fragment classes for merge_fragmented_rules
+_FRAG_NORMAL = 0   # anything else
+_FRAG_PAREN = 1    # just a parenthetical like "(1)" or "(3\")"
+_FRAG_CAPWORD = 2  # single capitalized word like "Indirect"
+_PAREN_FRAG_RE = re.compile(r'^\([^)]+\)$')
+_CAPWORD_FRAG_RE = re.compile(r'^[A-Z][a-z]+$')
+
+
+def _fix_smoke_chem_rules(rules: List[str], ammo_type: str) -> List[str]:
+    """Reattach orphaned radius markers to Smoke/Chemical-SP shot rules.
+
+    OCR often leaves the ammo type in the shot name and just the radius
+    in the special rules, e.g. name "82mm Smoke" with rule "(3)" should
+    read "Smoke (3\")".
+    """
+    fixed_rules = []
+    for rule in rules:
+        if _RADIUS_RULE_RE.match(rule):
+            # Ensure proper quote formatting: "(3)" -> "(3\")"
+            if '"' not in rule and ')' in rule:
+                rule = rule.replace(')', '\")')
+            fixed_rules.append(f"{ammo_type} {rule}")
+        else:
+            fixed_rules.append(rule)
+    return fixed_rules
+
+
 def merge_fragmented_rules(rules: List[str]) -> List[str]:
     """Merge special rule fragments that were incorrectly split.
 
@@ -375,38 +499,44 @@ def merge_fragmented_rules(rules: List[str]) -> List[str]:
     if not rules:
         return rules
 
+    # Classify each fragment once; the merge loop below is then pure
+    # integer comparisons with no regex work per iteration
+    tags = []
+    for rule in rules:
+        if _PAREN_FRAG_RE.match(rule):
+            tags.append(_FRAG_PAREN)
+        elif _CAPWORD_FRAG_RE.match(rule):
+            tags.append(_FRAG_CAPWORD)
+        else:
+            tags.append(_FRAG_NORMAL)
+
     merged = []
     i = 0
-    while i < len(rules):
+    n = len(rules)
+    while i < n:
         rule = rules[i]
 
-        # Check if this rule is just a parenthetical like "(1)" or "(3\")"
-        if i > 0 and re.match(r'^\([^)]+\)$', rule):
-            # Merge with previous rule
+        # A lone parenthetical belongs to the previous rule
+        if i > 0 and tags[i] == _FRAG_PAREN:
             merged[-1] = f"{merged[-1]} {rule}"
             i += 1
             continue
 
         # Check if next rule looks like it should be part of this one
-        # Pattern: current rule doesn't end with paren, next is a word that could continue it
-        if i + 1 < len(rules):
-            next_rule = rules[i + 1]
-            # If current doesn't end with ) and next is either a word or a parenthetical
-            if not rule.endswith(')') and (
-                re.match(r'^[A-Z][a-z]+$', next_rule) or  # Single capitalized word
-                re.match(r'^\([^)]+\)$', next_rule)  # Parenthetical
-            ):
-                # Look ahead to see if there's a parenthetical after the next word
-                if i + 2 < len(rules) and re.match(r'^\([^)]+\)$', rules[i + 2]):
-                    # Pattern: "Light" "Indirect" "(1)" -> "Light Indirect (1)"
-                    merged.append(f"{rule} {next_rule} {rules[i + 2]}")
-                    i += 3
-                    continue
-                elif re.match(r'^\([^)]+\)$', next_rule):
-                    # Pattern: "Indirect" "(1)" -> "Indirect (1)"
-                    merged.append(f"{rule} {next_rule}")
-                    i += 2
-                    continue
+        # Pattern: current rule doesn't end with paren, next is a word
+        # or parenthetical that could continue it
+        if i + 1 < n and not rule.endswith(')') and tags[i + 1] != _FRAG_NORMAL:
+            # Look ahead to see if there's a parenthetical after the next word
+            if i + 2 < n and tags[i + 2] == _FRAG_PAREN:
+                # Pattern: "Light" "Indirect" "(1)" -> "Light Indirect (1)"
+                merged.append(f"{rule} {rules[i + 1]} {rules[i + 2]}")
+                i += 3
+                continue
+            elif tags[i + 1] == _FRAG_PAREN:
+                # Pattern: "Indirect" "(1)" -> "Indirect (1)"
+                merged.append(f"{rule} {rules[i + 1]}")
+                i += 2
+                continue
 
         # No merging needed
         merged.append(rule)
@@ -420,11 +550,50 @@ try:
 except Exception:
     jsonschema_validate = None
 
+# Optional fast JSON serialization for the roster write
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional fast fuzzy matching - rapidfuzz's C++ ratio is ~50x faster
+# than difflib's SequenceMatcher on the OCR/PDF line-matching loop
+try:
+    from rapidfuzz import fuzz as rapidfuzz_fuzz
+except ImportError:
+    rapidfuzz_fuzz = None
+
+# Optional numpy for vectorized line grouping in reconstruct_lines
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional in-process Tesseract bindings - avoids the temp-file +
+# subprocess + TSV-parse overhead pytesseract pays on every call
+try:
+    import tesserocr
+except ImportError:
+    tesserocr = None
+
+_tesserocr_api = None
+
+
+def _get_tesserocr_api():
+    """One long-lived PyTessBaseAPI per process (LSTM-only, single block)"""
+    global _tesserocr_api
+    if _tesserocr_api is None:
+        _tesserocr_api = tesserocr.PyTessBaseAPI(
+            psm=tesserocr.PSM.SINGLE_BLOCK,
+            oem=tesserocr.OEM.LSTM_ONLY,
+        )
+    return _tesserocr_api
+
 
 # -----------------------------
 # OCR-based text extraction
 # -----------------------------
-@dataclass
+@dataclass(slots=True)
 class WordBox:
     """A word with its bounding box and formatting"""
     text: str
@@ -451,18 +620,25 @@ def extract_text_lines_from_pdf(page, bbox: Tuple[float, float, float, float]) -
     """
     x0, top, x1, bottom = bbox
 
-    # Get all characters in the bbox
-    chars = page.chars
-
-    # Filter to chars within bbox
+    # Filter page.chars directly - pdfplumber caches the page's object
+    # tree after the first access, so this is one list scan per card,
+    # whereas within_bbox() builds a whole FilteredPage per call
     bbox_chars = [
-        char for char in chars
-        if x0 <= char['x0'] <= x1 and top <= char['top'] <= bottom
+        c for c in page.chars
+        if c['x0'] >= x0 and c['x1'] <= x1 and c['top'] >= top and c['bottom'] <= bottom
     ]
 
     if not bbox_chars:
         return []
 
+    # Pages use a handful of fonts, so classify each fontname once and
+    # do a set lookup per char instead of three substring scans
+    font_names = {c.get('fontname', '') for c in bbox_chars}
+    italic_fonts = {
+        fn for fn in font_names
+        if 'Italic' in fn or 'italic' in fn or 'Oblique' in fn
+    }
+
     # Group characters into lines by y-position
     # Sort by y first
     bbox_chars.sort(key=lambda c: (c['top'], c['x0']))
@@ -497,7 +673,7 @@ def extract_text_lines_from_pdf(page, bbox: Tuple[float, float, float, float]) -
         # Determine formatting - check if majority of chars are italic
         italic_count = sum(
             1 for c in line_chars
-            if 'Italic' in c.get('fontname', '') or 'italic' in c.get('fontname', '') or 'Oblique' in c.get('fontname', '')
+            if c.get('fontname', '') in italic_fonts
         )
         is_italic = italic_count > len(line_chars) / 2
 
@@ -509,8 +685,13 @@ def extract_text_lines_from_pdf(page, bbox: Tuple[float, float, float, float]) -
     return line_boxes
 
 
-def extract_words_with_ocr(image: Image.Image, formatting_map: Optional[Dict] = None) -> List[WordBox]:
-    """Extract words with bounding boxes using OCR"""
+def extract_words_with_ocr(image: Image.Image, formatting_map: Optional[Dict] = None, psm: int = 6) -> List[WordBox]:
+    """Extract words with bounding boxes using OCR
+
+    psm selects Tesseract's page segmentation: 6 (uniform block, the
+    default) for card/page composites, 7 (single text line) for
+    single-line strip crops, which skips block layout analysis.
+    """
     # For printed text in PDFs, use the image directly without preprocessing
     # Contrast/sharpening can introduce artifacts that hurt OCR accuracy
 
@@ -518,10 +699,40 @@ def extract_words_with_ocr(image: Image.Image, formatting_map: Optional[Dict] =
     if image.mode != 'L':
         image = image.convert('L')
 
+    # In-process libtesseract bindings skip the temp-file write, fork/
+    # exec, and TSV parse pytesseract pays per call
+    if tesserocr is not None:
+        api = _get_tesserocr_api()
+        api.SetPageSegMode(
+            tesserocr.PSM.SINGLE_LINE if psm == 7 else tesserocr.PSM.SINGLE_BLOCK
+        )
+        # Hand Tesseract the raw grayscale bytes (1 byte/pixel, row
+        # stride = width) - SetImage would round-trip through an image
+        # encode/decode that SetImageBytes skips entirely
+        api.SetImageBytes(image.tobytes(), image.width, image.height, 1, image.width)
+        api.Recognize()
+        words = []
+        ri = api.GetIterator()
+        if ri is not None:
+            level = tesserocr.RIL.WORD
+            for r in tesserocr.iterate_level(ri, level):
+                try:
+                    text = r.GetUTF8Text(level).strip()
+                except RuntimeError:
+                    continue
+                if not text:
+                    continue
+                # Filter out very low confidence results
+                if r.Confidence(level) < 30:
+                    continue
+                text = _fix_word_text(text)
+                x0, y0, x1, y1 = r.BoundingBox(level)
+                words.append(WordBox(text=text, x0=x0, y0=y0, x1=x1, y1=y1, is_bold=False, is_italic=False))
+        return words
+
     # Configure tesseract for printed text
-    # --psm 6: Assume a single uniform block of text
     # --oem 1: Use LSTM OCR engine (best for modern printed text)
-    custom_config = r'--oem 1 --psm 6'
+    custom_config = rf'--oem 1 --psm {psm}'
 
     # Use pytesseract to get word-level data
     data = pytesseract.image_to_data(
@@ -531,9 +742,28 @@ def extract_words_with_ocr(image: Image.Image, formatting_map: Optional[Dict] =
     )
 
     words = []
-    n_boxes = len(data['text'])
+    texts = data['text']
+
+    if np is not None:
+        # Filter the confidence column in C before the Python loop and
+        # only touch the surviving indices
+        conf_mask = np.asarray(data['conf'], dtype=np.int16) >= 30
+        keep = [i for i, t in enumerate(texts) if conf_mask[i] and t.strip()]
+        left = data['left']
+        top = data['top']
+        width = data['width']
+        height = data['height']
+        for i in keep:
+            text = _fix_word_text(texts[i].strip())
+            x0 = left[i]
+            y0 = top[i]
+            # Note: We don't assign formatting here anymore - it's done via fuzzy matching later
+            words.append(WordBox(text=text, x0=x0, y0=y0, x1=x0 + width[i], y1=y0 + height[i], is_bold=False, is_italic=False))
+        return words
+
+    n_boxes = len(texts)
     for i in range(n_boxes):
-        text = data['text'][i].strip()
+        text = texts[i].strip()
         if not text:
             continue
 
@@ -542,41 +772,7 @@ def extract_words_with_ocr(image: Image.Image, formatting_map: Optional[Dict] =
         if conf < 30:  # Skip words with very low confidence
             continue
 
-        # Fix common OCR errors
-        # $ is often misread as S in stat lines
-        text = re.sub(r'\$(\d+)"', r'S\1"', text)  # $32" -> S32"
-        # 0 vs O - but NOT for MO" (movement 0)
-        if not re.match(r'^MO"', text):
-            text = re.sub(r'\bO(\d)', r'0\1', text)  # O2 -> 02
-        # 1 vs l in some contexts
-        text = re.sub(r'(\d)l"', r'\1"', text)  # 8l" -> 8"
-        # Common character confusions
-        text = text.replace('|', 'I')  # pipe to I
-        text = text.replace('}', ')')
-        text = text.replace('{', '(')
-
-        # Debug: log all words that contain quotes (disabled)
-        # if '"' in text or "'" in text:
-        #     print(f"DEBUG WORD with quote: '{text}'")
-
-        # Fix range OCR errors (must be done at word level before line reconstruction)
-        orig_text = text
-        # Re" is R40" misread
-        if text == 'Re"':
-            text = 'R40"'
-        # Reo" is R40" misread
-        elif text == 'Reo"':
-            text = 'R40"'
-        # Ro" is R0" misread
-        elif text == 'Ro"':
-            text = 'R0"'
-        # R4o" is R40" misread
-        elif text == 'R4o"':
-            text = 'R40"'
-
-        # Debug output for word fixes (disabled)
-        # if orig_text != text:
-        #     print(f"DEBUG WORD FIX: '{orig_text}' -> '{text}'")
+        text = _fix_word_text(text)
 
         x0 = data['left'][i]
         y0 = data['top'][i]
@@ -589,62 +785,88 @@ def extract_words_with_ocr(image: Image.Image, formatting_map: Optional[Dict] =
     return words
 
 
+# Precompiled OCR-fix patterns. These run once per word/line across the
+# whole book, so they're compiled at module scope and each sub is gated
+# behind a cheap substring prefilter where possible.
+_DOLLAR_QUOTE_RE = re.compile(r'\$(\d+)"')  # Spotting: $32" -> S32"
+# Range misreads: Reo"/R4o"/Re" -> R40", Ro" -> R0"
+_RANGE_FIX_MAP = {'Reo"': 'R40"', 'R4o"': 'R40"', 'Re"': 'R40"', 'Ro"': 'R0"'}
+_CLASS_FLAG_SPACE_RE = re.compile(r'(Inf|Vec|Air)\s+\(([SWCML]+|CAP|CAS)\)')
+
+# All the contextual line fixes fused into one alternation so a line is
+# scanned once instead of once per fix. The class-flag sub stays
+# separate below because the " lnf " -> " Inf " fix can create its
+# input. Dispatch is keyed on m.lastgroup (the outer branch name -
+# the outer group closes after its nested _n capture).
+_LINE_FIX_RE = re.compile(
+    r'(?P<dq>\$(?P<dq_n>\d+)")'        # $32" -> S32" (spotting)
+    r'|(?P<ds>\$(?P<ds_n>\d+)/)'       # $3/ -> S3/ (strength)
+    r'|(?P<dt>,\s*\$(?P<dt_n>\d+))'    # , $14 -> , S14
+    r'|(?P<el>\bEl\b)'                 # evasion: l looks like 4
+    r'|(?P<eo>\bEO\b)'                 # evasion: O -> 0
+    r'|(?P<rng>R(?:eo|4o|e|o)")'       # range misreads
+    r'|(?P<lnf> lnf )'                 # l -> I in Inf
+    r'|(?P<alr> Alr )'                 # l -> i in Air
+    r'|(?P<pts>(?P<pts_n>\d+)\s*(?i:p[t|l]s)\b)'  # pts formatting
+)
+_LINE_FIX_HANDLERS = {
+    'dq': lambda m: 'S' + m['dq_n'] + '"',
+    'ds': lambda m: 'S' + m['ds_n'] + '/',
+    'dt': lambda m: ', S' + m['dt_n'],
+    'el': lambda m: 'E4',
+    'eo': lambda m: 'E0',
+    'rng': lambda m: _RANGE_FIX_MAP[m['rng']],
+    'lnf': lambda m: ' Inf ',
+    'alr': lambda m: ' Air ',
+    'pts': lambda m: m['pts_n'] + ' pts',
+}
+
+
+def _line_fix_dispatch(m: 're.Match') -> str:
+    return _LINE_FIX_HANDLERS[m.lastgroup](m)
+
+# Word-level fixes in extract_words_with_ocr
+_MO_PREFIX_RE = re.compile(r'^MO"')
+_O_DIGIT_RE = re.compile(r'\bO(\d)')  # O2 -> 02
+_DIGIT_L_QUOTE_RE = re.compile(r'(\d)l"')  # 8l" -> 8"
+_WORD_RANGE_FIX = {'Re"': 'R40"', 'Reo"': 'R40"', 'Ro"': 'R0"', 'R4o"': 'R40"'}
+
+
+def _fix_word_text(text: str) -> str:
+    """Fix common word-level OCR errors (shared by both OCR backends)"""
+    # $ is often misread as S in stat lines
+    if '$' in text:
+        text = _DOLLAR_QUOTE_RE.sub(r'S\1"', text)  # $32" -> S32"
+    # 0 vs O - but NOT for MO" (movement 0)
+    if 'O' in text and not _MO_PREFIX_RE.match(text):
+        text = _O_DIGIT_RE.sub(r'0\1', text)  # O2 -> 02
+    # 1 vs l in some contexts
+    if 'l' in text:
+        text = _DIGIT_L_QUOTE_RE.sub(r'\1"', text)  # 8l" -> 8"
+    # Common character confusions
+    text = text.replace('|', 'I')  # pipe to I
+    text = text.replace('}', ')')
+    text = text.replace('{', '(')
+
+    # Fix range OCR errors (must be done at word level before line
+    # reconstruction) - exact-match misreads, so a dict lookup
+    return _WORD_RANGE_FIX.get(text, text)
+
+
 def fix_ocr_errors_contextual(line: str) -> str:
     """Fix OCR errors based on context"""
-    # Fix $ -> S in stat lines and weapon profiles (S for spotting/strength, not $)
-    line = re.sub(r'\$(\d+)"', r'S\1"', line)  # Spotting: $32" -> S32"
-    line = re.sub(r'\$(\d+)/', r'S\1/', line)  # Strength: $3/4 -> S3/4
-    line = re.sub(r',\s*\$(\d+)', r', S\1', line)  # Strength at end: , $14 -> , S14
-
-    # Fix common stat line errors
-    # H, S, M, Q, T, C should be followed by numbers
-    line = re.sub(r'\bH(\d+)', r'H\1', line)  # Ensure H + number
-    line = re.sub(r'\bS(\d+)"', r'S\1"', line)  # Ensure S + number + quote
-    line = re.sub(r'\bM(\d+)"', r'M\1"', line)  # Ensure M + number + quote
-    line = re.sub(r'\bQ(\d+)', r'Q\1', line)  # Ensure Q + number
-    line = re.sub(r'\bC(\d+)', r'C\1', line)  # Ensure C + number
-
-    # Fix E (evasion) OCR errors: El -> E4, EO -> E0, etc.
-    line = re.sub(r'\bEl\b', r'E4', line)  # l looks like 4
-    line = re.sub(r'\bEO\b', r'E0', line)  # O -> 0
-    line = re.sub(r'\bE([lO])', r'E\1', line)  # General E + letter
-
-    # Fix weapon profile line errors
-    # R, A, S, D should be followed by numbers or +/- characters
-    line = re.sub(r'\bR(\d+)"', r'R\1"', line)  # Range
-    line = re.sub(r'\bA(\d+)', r'A\1', line)  # Accuracy
-    line = re.sub(r'\bD(\d+)', r'D\1', line)  # Damage
-
-    # Fix common OCR errors in range values (fix longer patterns first)
-    orig_line = line
-    # Reo" is R40" with o instead of 0
-    line = re.sub(r'Reo"', r'R40"', line)
-    # R4o" is R40" with o instead of 0
-    line = re.sub(r'R4o"', r'R40"', line)
-    # Re" is often R40" misread (4 and 0 become 'e')
-    line = re.sub(r'Re"', r'R40"', line)
-    # Ro" is often R0" misread (0 becomes o)
-    line = re.sub(r'Ro"', r'R0"', line)
-
-    # Debug: print if we made any changes (disabled)
-    # if orig_line != line:
-    #     print(f"DEBUG LINE FIX: '{orig_line}' -> '{line}'")
-
-    # Common word confusions in military context
-    line = line.replace(' Vec ', ' Vec ')  # Ensure Vec
-    line = line.replace(' lnf ', ' Inf ')  # l -> I in Inf
-    line = line.replace(' Alr ', ' Air ')  # l -> i in Air
-
-    # Fix pts formatting
-    line = re.sub(r'(\d+)\s*p[t|l]s\b', r'\1 pts', line, flags=re.IGNORECASE)
+    # $ -> S in stat lines, evasion El/EO, range misreads, lnf/Alr
+    # confusions, and pts formatting in a single scan
+    line = _LINE_FIX_RE.sub(_line_fix_dispatch, line)
 
     # Remove spaces before class flags: "Inf (S)" -> "Inf(S)", "Vec (W)" -> "Vec(W)", "Air (CAP)" -> "Air(CAP)"
-    line = re.sub(r'(Inf|Vec|Air)\s+\(([SWCML]+|CAP|CAS)\)', r'\1(\2)', line)
+    if '(' in line:
+        line = _CLASS_FLAG_SPACE_RE.sub(r'\1(\2)', line)
 
     return line
 
 
-@dataclass
+@dataclass(slots=True)
 class LineBox:
     """A line of text with formatting info"""
     text: str
@@ -662,11 +884,20 @@ def reconstruct_lines(words: List[WordBox], y_tolerance: float = 5.0) -> List[st
 
     # Group words into lines by y-position
     lines: List[List[WordBox]] = []
-    current_line: List[WordBox] = [words[0]]
+    if np is not None and len(words) > 1:
+        # Vectorized grouping: sort by center_y and break where the gap
+        # between consecutive words exceeds the tolerance. Avoids the
+        # quadratic running-average recompute of the Python loop.
+        ys = np.fromiter((w.center_y for w in words), dtype=np.float32, count=len(words))
+        order = np.argsort(ys, kind='stable')
+        breaks = np.where(np.diff(ys[order]) > y_tolerance)[0]
+        for group in np.split(order, breaks + 1):
+            lines.append([words[i] for i in group])
+    else:
+        current_line: List[WordBox] = [words[0]]
 
-    for word in words[1:]:
-        # Check if this word is on the same line as the current line
-        if len(current_line) > 0:
+        for word in words[1:]:
+            # Check if this word is on the same line as the current line
             avg_y = sum(w.center_y for w in current_line) / len(current_line)
             if abs(word.center_y - avg_y) <= y_tolerance:
                 current_line.append(word)
@@ -674,11 +905,9 @@ def reconstruct_lines(words: List[WordBox], y_tolerance: float = 5.0) -> List[st
                 # Start a new line
                 lines.append(current_line)
                 current_line = [word]
-        else:
-            current_line.append(word)
 
-    if current_line:
-        lines.append(current_line)
+        if current_line:
+            lines.append(current_line)
 
     # Sort words in each line by x-position and join
     text_lines = []
@@ -694,12 +923,20 @@ def reconstruct_lines(words: List[WordBox], y_tolerance: float = 5.0) -> List[st
     return text_lines
 
 
+_NORM_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_for_matching(text: str) -> str:
-    """Normalize text for fuzzy matching - remove punctuation, extra spaces, lowercase"""
+    """Normalize text for fuzzy matching - remove punctuation, extra spaces, lowercase
+
+    Cached - the same stat and rule lines recur across cards, and the
+    matcher normalizes every line of every card.
+    """
     # Remove special characters and extra spaces
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\s+', ' ', text)
-    return text.strip().lower()
+    text = _NORM_PUNCT_RE.sub('', text)
+    # ' '.join(split()) collapses and strips whitespace in one pure-C pass
+    return ' '.join(text.split()).lower()
 
 
 def match_ocr_to_pdf_lines(ocr_lines: List[str], pdf_line_boxes: List[LineBox]) -> List[LineBox]:
@@ -720,6 +957,9 @@ def match_ocr_to_pdf_lines(ocr_lines: List[str], pdf_line_boxes: List[LineBox])
     used_pdf_indices = set()
     result = []
 
+    # Normalize PDF lines once, not once per OCR line
+    norm_pdf_lines = [normalize_for_matching(pdf_box.text) for pdf_box in pdf_line_boxes]
+
     for ocr_idx, ocr_line in enumerate(ocr_lines):
         if not ocr_line.strip():
             result.append(LineBox(text=ocr_line, is_bold=False, is_italic=False))
@@ -738,10 +978,13 @@ def match_ocr_to_pdf_lines(ocr_lines: List[str], pdf_line_boxes: List[LineBox])
             if pdf_idx in used_pdf_indices:
                 continue
 
-            norm_pdf = normalize_for_matching(pdf_box.text)
+            norm_pdf = norm_pdf_lines[pdf_idx]
 
-            # Use SequenceMatcher for fuzzy matching
-            ratio = SequenceMatcher(None, norm_ocr, norm_pdf).ratio()
+            # Fuzzy match - rapidfuzz (C++) when available, else difflib
+            if rapidfuzz_fuzz is not None:
+                ratio = rapidfuzz_fuzz.ratio(norm_ocr, norm_pdf) / 100.0
+            else:
+                ratio = SequenceMatcher(None, norm_ocr, norm_pdf).ratio()
 
             if ratio > best_ratio:
                 best_ratio = ratio
@@ -763,41 +1006,49 @@ def match_ocr_to_pdf_lines(ocr_lines: List[str], pdf_line_boxes: List[LineBox])
     return result
 
 
-def extract_card_text_ocr(
+@functools.lru_cache(maxsize=2)
+def _render_page(pdf_path: str, page_num: int, dpi: int) -> Optional[Image.Image]:
+    """Render a PDF page once and cache it by page number
+
+    A page with several cards was previously re-rasterized through
+    poppler once per card; the LRU keeps the current page hot while the
+    driver walks cards in page order. Kept at 2 so each worker's RSS
+    stays bounded to a couple of page bitmaps (~8 MB each grayscale at
+    300 DPI) no matter how long the book is.
+    """
+    # grayscale=True renders 1 byte/pixel inside poppler itself, so the
+    # page bitmap is a third the size and the PIL convert('L') in
+    # extract_words_with_ocr becomes a no-op
+    images = convert_from_path(
+        pdf_path,
+        first_page=page_num + 1,
+        last_page=page_num + 1,
+        dpi=dpi,
+        grayscale=True,
+        thread_count=os.cpu_count(),
+    )
+    return images[0] if images else None
+
+
+def ocr_card_lines(
     pdf_path: str,
     page_num: int,
-    page,  # Pass the pdfplumber page object
     bbox: Tuple[float, float, float, float],
     dpi: int = 300,
     debug: bool = False,
     debug_path: Optional[str] = None
-) -> Tuple[str, List[LineBox]]:
-    """Extract text from a card using hybrid OCR + PDF approach
-
-    Uses OCR for text accuracy and PDF for formatting information.
-    Matches OCR lines to PDF lines using fuzzy matching.
+) -> List[str]:
+    """Render one card region and OCR it, returning plain text lines
 
-    Returns:
-        Tuple of (plain text string for compatibility, list of LineBox objects with formatting)
+    Pure render+OCR path with no pdfplumber objects involved, so it can
+    run in a worker process.
     """
     x0, top, x1, bottom = bbox
 
-    # Step 1: Extract text lines from PDF with formatting
-    pdf_line_boxes_raw = extract_text_lines_from_pdf(page, bbox)
-
-    # Filter out separator lines (underscores) and other noise from PDF
-    pdf_line_boxes = [
-        lb for lb in pdf_line_boxes_raw
-        if lb.text.strip() and not re.match(r'^_+$', lb.text.strip())
-    ]
-
-    # Step 2: Extract text using OCR for better accuracy
-    # Convert PDF page to image
-    images = convert_from_path(pdf_path, first_page=page_num + 1, last_page=page_num + 1, dpi=dpi)
-    if not images:
-        return "", []
-
-    img = images[0]
+    # Convert PDF page to image (cached - pages hold several cards)
+    img = _render_page(pdf_path, page_num, dpi)
+    if img is None:
+        return []
 
     # Scale bbox coordinates to image resolution
     # PDF coordinates are in points (72 DPI), we're rendering at higher DPI
@@ -814,7 +1065,6 @@ def extract_card_text_ocr(
 
     # Save debug image if requested
     if debug and debug_path:
-        import os
         os.makedirs(debug_path, exist_ok=True)
         card_img.save(f"{debug_path}/card_p{page_num}_orig.png")
 
@@ -822,7 +1072,125 @@ def extract_card_text_ocr(
     words = extract_words_with_ocr(card_img, formatting_map=None)
 
     # Reconstruct lines from OCR (plain text, no formatting yet)
-    ocr_lines = reconstruct_lines(words)
+    return reconstruct_lines(words)
+
+
+def ocr_page_cards(
+    pdf_path: str,
+    page_num: int,
+    bboxes: List[Tuple[float, float, float, float]],
+    dpi: int = 300,
+    debug: bool = False,
+    debug_path: Optional[str] = None
+) -> List[List[str]]:
+    """OCR every card on a page with a single Tesseract call
+
+    Card crops are stacked into one composite image separated by white
+    strips, OCR'd once, and the words bucketed back to their cards by
+    y-offset. Amortizes Tesseract startup/LSTM warmup across all cards
+    on the page.
+
+    Returns one list of OCR text lines per bbox, in bbox order.
+    """
+    if not bboxes:
+        return []
+
+    img = _render_page(pdf_path, page_num, dpi)
+    if img is None:
+        return [[] for _ in bboxes]
+
+    scale = dpi / 72.0
+    crops = []
+    for i, (x0, top, x1, bottom) in enumerate(bboxes):
+        crop_box = (
+            int(x0 * scale),
+            int(top * scale),
+            int(x1 * scale),
+            int(bottom * scale)
+        )
+        card_img = img.crop(crop_box)
+        crops.append(card_img)
+
+        # Save debug image if requested
+        if debug and debug_path:
+            os.makedirs(debug_path, exist_ok=True)
+            card_img.save(f"{debug_path}/card_p{page_num}_{i}_orig.png")
+
+    # Stack the crops vertically with white separator strips so one
+    # --psm 6 pass covers the whole page's cards
+    separator = 50  # px of whitespace between cards
+    width = max(c.width for c in crops)
+    height = sum(c.height for c in crops) + separator * (len(crops) - 1)
+    composite = Image.new('L', (width, height), 255)
+    spans = []  # (y_start, y_end) of each card in the composite
+    y = 0
+    for card_img in crops:
+        if card_img.mode != 'L':
+            card_img = card_img.convert('L')
+        composite.paste(card_img, (0, y))
+        spans.append((y, y + card_img.height))
+        y += card_img.height + separator
+
+    # The card crops are pasted into the composite, so their pixel
+    # buffers can go before the (memory-hungry) OCR pass runs
+    for card_img in crops:
+        card_img.close()
+    del crops
+
+    words = extract_words_with_ocr(composite, formatting_map=None)
+    composite.close()
+
+    # Bucket words back to their cards and shift y back to card-local
+    # coordinates (the separator gap goes to the card above it)
+    card_words: List[List[WordBox]] = [[] for _ in spans]
+    for word in words:
+        cy = word.center_y
+        for idx, (y_start, y_end) in enumerate(spans):
+            if y_start <= cy < y_end + separator:
+                word.y0 -= y_start
+                word.y1 -= y_start
+                card_words[idx].append(word)
+                break
+
+    return [reconstruct_lines(ws) for ws in card_words]
+
+
+def extract_card_text_ocr(
+    pdf_path: str,
+    page_num: int,
+    page,  # Pass the pdfplumber page object
+    bbox: Tuple[float, float, float, float],
+    dpi: int = 300,
+    debug: bool = False,
+    debug_path: Optional[str] = None,
+    ocr_lines: Optional[List[str]] = None
+) -> Tuple[str, List[LineBox]]:
+    """Extract text from a card using hybrid OCR + PDF approach
+
+    Uses OCR for text accuracy and PDF for formatting information.
+    Matches OCR lines to PDF lines using fuzzy matching.
+
+    Pass `ocr_lines` (from ocr_card_lines) to reuse OCR output computed
+    in a worker process.
+
+    Returns:
+        Tuple of (plain text string for compatibility, list of LineBox objects with formatting)
+    """
+    # Step 1: Extract text lines from PDF with formatting
+    pdf_line_boxes_raw = extract_text_lines_from_pdf(page, bbox)
+
+    # Filter out separator lines (underscores) and other noise from PDF
+    pdf_line_boxes = [
+        lb for lb in pdf_line_boxes_raw
+        if lb.text.strip() and not re.match(r'^_+$', lb.text.strip())
+    ]
+
+    # Step 2: Extract text using OCR for better accuracy (unless the
+    # caller already OCR'd this card in a worker process)
+    if ocr_lines is None:
+        ocr_lines = ocr_card_lines(pdf_path, page_num, bbox, dpi=dpi, debug=debug, debug_path=debug_path)
+    if not ocr_lines:
+        return "", []
 
     # Step 3: Match OCR lines to PDF lines to transfer formatting
     line_boxes = match_ocr_to_pdf_lines(ocr_lines, pdf_line_boxes)
@@ -889,27 +1257,95 @@ PROFILE_RE = re.compile(
     re.IGNORECASE,
 )
 
-# Simpler regex to detect if a line looks like a weapon profile (for filtering)
+# Simpler regex to detect if a line looks like a weapon profile (for
+# filtering). Only ever used as a boolean search, so the all-optional
+# target prefix of PROFILE_RE is dropped: starting at the required
+# R\d+" literal lets the engine reject non-matching lines in a single
+# substring scan instead of retrying the optional prefix at every
+# position. The stat fields use negated classes ([^,]+), so failed
+# candidates backtrack within one field rather than across the line.
 PROFILE_DETECT_RE = re.compile(
-    r"(?:All|Inf|Vec|Air|Gnd|Inf/Vec)?\s*,?\s*R\d+\"\s*,?\s*A[^,]+\s*,?\s*(?:S[^,]+\s*,?\s*)?D\d+",
+    r"R\d+\"\s*,?\s*A[^,]+\s*,?\s*(?:S[^,]+\s*,?\s*)?D\d+",
     re.IGNORECASE
 )
 
-FOOTER_NOISE_RE = re.compile(r"\bFIRELOCK\b|\bM\.D\.C\.\b|FEDERAL STATES-ARMY|DREKFORT", re.IGNORECASE)
+# Footer noise tokens, checked with plain substring tests after one
+# upper() - cheaper than an alternation regex on the per-line filter
+_FOOTER_NOISE_TOKENS = ("FIRELOCK", "M.D.C.", "FEDERAL STATES-ARMY", "DREKFORT")
+
+
+def _is_footer_noise(text: str) -> bool:
+    upper = text.upper()
+    return any(tok in upper for tok in _FOOTER_NOISE_TOKENS)
+
+
+# Inline patterns from parse_card_text, hoisted to module scope - the
+# bound pattern.match() skips re's cache lookup and flag parsing on
+# every one of the many short lines each card produces
+_UNIT_TYPE_TOKENS = frozenset(('Inf', 'Vec', 'Air'))
+_CLASS_FLAG_PREFIX_RE = re.compile(r'^\([SWCML]+|CAP|CAS\)')
+_SPECIAL_RULE_NAMEY_RE = re.compile(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:,.*)?$')
+_AT_PLUS_SUB_RE = re.compile(r'(,\s*)At(\+)')
+_PTS_INLINE_RE = re.compile(r"(\d+)\s*pts", re.IGNORECASE)
+_DASH_PTS_RE = re.compile(r"^\s*-\s*(\d+(?:/\d+)?)\s*pts\s*$", re.IGNORECASE)
+_NAME_DASH_PTS_RE = re.compile(r"^(.+?)\s*-\s*(\d+(?:/\d+)?)\s*$")
+_CALIBER_RE = re.compile(r'(\d+mm)')
+_AMMO_LINE_RE = re.compile(r'^Ammo\s+(\d+)$', re.IGNORECASE)
+_AMMO_SUB_RE = re.compile(r'\s*Ammo\s+\d+\s*', re.IGNORECASE)
+# Blast-radius markers like (3") attached to Smoke/Chemical shot rules
+_RADIUS_RULE_RE = re.compile(r'^\([0-9]+"?\)$')
+# Common OCR misreads of range digits: "0" -> O/o, "40" -> e/eo/4o
+_RANGE_OCR_FIXUPS = {"o": "0", "e": "40", "eo": "40", "4o": "40"}
+# Category headings a card can legitimately sit under
+_VALID_CATEGORIES = frozenset((
+    'TACOMS', 'Infantry', 'Vehicles', 'Aircraft', 'Emplacements', 'Support', 'Scenario'
+))
+# Categories that carry no unit-class implication to cross-check
+_CLASSLESS_CATEGORIES = frozenset(('TACOMS', 'Emplacements', 'Support', 'Scenario'))
+# unitClass substring -> category, in match-priority order
+_CLASS_TO_CAT = (("Inf", "Infantry"), ("Vec", "Vehicles"), ("Air", "Aircraft"))
+_CAT_TO_CLASS = {"Infantry": "Inf", "Vehicles": "Vec", "Aircraft": "Air"}
+# (search, strip) pattern pairs for special rules embedded in weapon
+# names; compiled once rather than per weapon
+_EMBEDDED_RULE_PATTERNS = [
+    (rule, re.compile(r'\b' + rule + r'\b'), re.compile(r'\s*\b' + rule + r'\b\s*'))
+    for rule in ('Turret', 'No CC', 'Multi-Gun')
+]
+# Unit-ability sentence openers - startswith takes the whole tuple in
+# one C call. Mortar skip-words for deriving a type from the
+# descriptive category.
+_SENTENCE_STARTER_PREFIXES = tuple(
+    w + ' ' for w in ('All', 'The', 'Each', 'When', 'If', 'Any', 'This', 'Target', 'Units')
+)
+_MORTAR_SKIP_WORDS = frozenset(('towed', 'mortar', 'self-propelled'))
+# First character a WEAPON_NAME_RE match can start with (code, caliber
+# name, or > ammo variant) - cheap reject before the merge lookahead
+_WEAPON_NAME_FIRSTCHAR_RE = re.compile(r'[0-9A-Z>]')
+# Deleting digits and comparing lengths is a C-level "has digit" test
+_DIGIT_DEL_TRANS = str.maketrans('', '', '0123456789')
+# Weapon code: starts with digit or letter, contains at least one digit
+_WEAPON_CODE_RE = re.compile(r'(?=\S*\d)[0-9A-Z][0-9A-Z\-]*\s+\S+')
+
+
+def _is_separator(s: str) -> bool:
+    """True for the all-underscore separator lines between card sections"""
+    s = s.strip()
+    return bool(s) and not s.strip('_')
 
 
 def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None) -> Optional[Dict[str, Any]]:
     """Parse card text into unit dict, using formatting information if available"""
     if line_boxes:
-        # Use line_boxes with formatting info
-        lines = [norm(lb.text) for lb in line_boxes if lb.text.strip()]
-        # Remove footer noise
+        # Use line_boxes with formatting info. One pass: bind the text
+        # local once per box, drop empty and footer-noise lines, and
+        # normalize each survivor once.
         filtered_boxes = []
         filtered_lines = []
         for lb in line_boxes:
-            if lb.text.strip() and not FOOTER_NOISE_RE.search(lb.text):
+            t = lb.text
+            if t.strip() and not _is_footer_noise(t):
                 filtered_boxes.append(lb)
-                filtered_lines.append(norm(lb.text))
+                filtered_lines.append(norm(t))
         line_boxes = filtered_boxes
         lines = filtered_lines
 
@@ -925,13 +1361,18 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
         lines = [norm(ln) for ln in (card_text or "").splitlines()]
         lines = [ln for ln in lines if ln.strip()]
         # Remove footer noise
-        lines = [ln for ln in lines if not FOOTER_NOISE_RE.search(ln)]
+        lines = [ln for ln in lines if not _is_footer_noise(ln)]
         # Create dummy line_boxes without formatting
         line_boxes = [LineBox(text=ln, is_bold=False, is_italic=False) for ln in lines]
 
     if not lines:
         return None
 
+    # SoA: everything below only needs each line's text (already in
+    # `lines`) and its italic flag, so pull the flags into a parallel
+    # list once instead of doing a LineBox attribute lookup per check
+    italics = [lb.is_italic for lb in line_boxes]
+
     # Debug: print first line to see which card we're parsing (disabled)
     # if "WHEAT" in lines[0].upper() or "KORENBLOEM" in lines[0].upper():
     #     print(f"\n{'='*80}")
@@ -951,54 +1392,61 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
     # IMPORTANT: Only do this merging if we DON'T have formatting info from line_boxes
     # When we have formatting, we can use it to distinguish special rules from weapons,
     # so we don't need the heuristic merging (which can cause index mismatches)
-    has_formatting = line_boxes and any(lb.is_italic for lb in line_boxes)
-
-    if not has_formatting:
-        merged_lines = []
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            # Check if this line is just a unit type and next line starts with class flag
-            if i + 1 < len(lines) and re.match(r'^(Inf|Vec|Air)$', line.strip()):
-                next_line = lines[i + 1].strip()
-                if re.match(r'^\([SWCML]+|CAP|CAS\)', next_line):
-                    # Merge them
-                    merged_lines.append(line + next_line)
-                    i += 2
-                    continue
-            merged_lines.append(line)
-            i += 1
-
-        lines = merged_lines
+    has_formatting = bool(italics) and any(italics)
+
+    # Pre-process in a single pass instead of three list rebuilds:
+    # (a) merge a bare unit type with the class-flag line that follows
+    #     it (only without formatting info),
+    # (b) merge split weapon name fragments, e.g.
+    #     "1M1V" / "Target Bearing" / "Transmitter"
+    #     -> "1M1V Target Bearing Transmitter",
+    # (c) fix the "At++" -> "A++" OCR error on the final form of each
+    #     line (after merging, matching the old pass order)
+    def _is_unit_type_split(j: int) -> bool:
+        """Would lines[j] be merged with lines[j+1] by step (a)?"""
+        return (not has_formatting and j + 1 < len(lines)
+                and lines[j].strip() in _UNIT_TYPE_TOKENS
+                and _CLASS_FLAG_PREFIX_RE.match(lines[j + 1].strip()) is not None)
 
-    # Pre-process: merge split weapon names
-    # OCR sometimes splits weapon names across multiple lines like:
-    # "1M1V"
-    # "Target Bearing"
-    # "Transmitter"
-    # These should be merged into "1M1V Target Bearing Transmitter"
     merged_lines = []
+    fragments = []  # reused across iterations of the merge lookahead
     i = 0
     while i < len(lines):
         line = lines[i]
-        # Skip merging for the first 3 lines (header and descriptive category)
-        # to avoid incorrectly merging header with descriptive category
-        if i >= 3 and (i + 1 < len(lines) and
-            len(line) < 30 and  # Short line
-            ',' not in line and  # No commas (profiles have commas)
-            not PROFILE_DETECT_RE.search(line) and  # Not a weapon profile
-            not STAT_RE.match(line) and  # Not a stats line
-            not re.match(r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:,.*)?$', line)):  # Not a special rule
+        step = 1
+
+        # (a) bare unit type + class flag split across lines
+        if _is_unit_type_split(i):
+            line = line + lines[i + 1].strip()
+            step = 2
+        # (b) split weapon names - skip the first 3 lines of the merged
+        # output (header and descriptive category) to avoid merging
+        # header with category. The guard must use the output position:
+        # a step-(a) merge earlier in the card shifts every following
+        # line one slot left relative to the raw index.
+        elif (len(merged_lines) >= 3 and i + 1 < len(lines) and
+              len(line) < 30 and  # Short line
+              ',' not in line and  # No commas (profiles have commas)
+              # A merge keeps line's first char, so it can only ever
+              # match WEAPON_NAME_RE if that char could start one
+              _WEAPON_NAME_FIRSTCHAR_RE.match(line) and
+              not PROFILE_DETECT_RE.search(line) and  # Not a weapon profile
+              not STAT_RE.match(line) and  # Not a stats line
+              not _SPECIAL_RULE_NAMEY_RE.match(line)):  # Not a special rule
 
             # Look ahead and collect potential weapon name fragments
-            fragments = [line]
+            fragments.clear()
+            fragments.append(line)
             j = i + 1
             while j < len(lines) and j < i + 4:  # Look ahead max 4 lines
                 next_line = lines[j]
-                # Stop if we hit a weapon profile, stats line, or comma-separated content
+                # Stop if we hit a weapon profile, stats line,
+                # comma-separated content, or a split stat line that
+                # step (a) will claim
                 if (PROFILE_DETECT_RE.search(next_line) or
                     STAT_RE.match(next_line) or
-                    (len(next_line) > 30)):
+                    (len(next_line) > 30) or
+                    _is_unit_type_split(j)):
                     break
                 # If it's a short line without commas, it might be part of weapon name
                 if len(next_line) < 30 and ',' not in next_line:
@@ -1007,31 +1455,24 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                 else:
                     break
 
-            # If we collected multiple fragments, merge them with spaces
+            # If we collected multiple fragments, merge them with
+            # spaces and keep the merge if it looks like a weapon name
             if len(fragments) > 1:
                 merged = ' '.join(fragments)
-                # Check if the merged version looks like a weapon name
                 if WEAPON_NAME_RE.match(merged):
-                    merged_lines.append(merged)
-                    i = j
-                    continue
+                    line = merged
+                    step = j - i
+
+        # (c) fix "At++" -> "A++" in weapon profiles,
+        # e.g. "Gnd, R6", At++/++, D2"
+        if 'At+' in line:
+            line = _AT_PLUS_SUB_RE.sub(r'\1A\2', line)
 
         merged_lines.append(line)
-        i += 1
+        i += step
 
     lines = merged_lines
 
-    # Pre-process: fix common OCR errors in weapon profiles
-    # OCR sometimes reads "A++" as "At++" in accuracy fields
-    corrected_lines = []
-    for line in lines:
-        # Fix "At++" -> "A++" in weapon profiles
-        # Match pattern like "Gnd, R6", At++/++, D2"
-        if re.search(r',\s*At\+', line):
-            line = re.sub(r'(,\s*)At(\+)', r'\1A\2', line)
-        corrected_lines.append(line)
-    lines = corrected_lines
-
     # Debug: print merged lines (disabled)
     # if "WHEAT" in lines[0].upper() or "KORENBLOEM" in lines[0].upper() or "BISON" in lines[0].upper():
     #     print(f"\n{'='*80}")
@@ -1040,58 +1481,66 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
     #     for i, line in enumerate(lines):
     #         print(f"  {i}: '{line}'")
 
-    # Find header line - can be split across multiple lines
+    # Find header line - can be split across multiple lines.
+    # All four header formats are tried in one pass over the first five
+    # lines, recording the first line each format matches; the winner
+    # is then resolved in the original priority order (standard, 3-line
+    # split, "- N pts" line, "name - N" + "pts" line), so no line is
+    # examined more than once.
     hm = None
     header_idx = 0
     unit_name = None
     points = None
 
-    # Try to match standard format first
-    for i, line in enumerate(lines[:5]):
+    n_lines = len(lines)
+    split3_i = split3_m = None
+    dash_pts_i = dash_pts_m = None
+    name_pts_i = name_pts_m = None
+    for i in range(min(5, n_lines)):
+        line = lines[i]
+        # Standard format: "NAME - N pts"
         hm = HEADER_RE.match(line)
         if hm:
-            unit_name = clean_unit_name(norm(hm.group("name")))
-            pts_str = hm.group("pts")
-            # Keep split costs as strings (e.g., "0/20"), convert single values to int
-            points = pts_str if '/' in pts_str else int(pts_str)
             header_idx = i
-            break
-
-    # If not found, try to find split format (name, -, pts on separate lines)
-    if not hm:
-        for i in range(min(3, len(lines) - 2)):
-            # Look for pattern: name line, "-" line, "N pts" line
-            if lines[i+1].strip() == "-" and "pts" in lines[i+2].lower():
-                pts_match = re.search(r"(\d+)\s*pts", lines[i+2], re.IGNORECASE)
-                if pts_match:
-                    unit_name = clean_unit_name(norm(lines[i]))
-                    points = int(pts_match.group(1))
-                    header_idx = i + 2  # Start looking for statline after pts line
-                    break
-
-        # If still not found, try: name line, "- N pts" line (dash and pts on same line)
-        if unit_name is None:
-            for i in range(min(4, len(lines) - 1)):
-                dash_pts_match = re.match(r"^\s*-\s*(\d+(?:/\d+)?)\s*pts\s*$", lines[i], re.IGNORECASE)
-                if dash_pts_match and i > 0:
-                    # Previous line should be the name
-                    unit_name = clean_unit_name(norm(lines[i-1]))
-                    pts_str = dash_pts_match.group(1)
-                    points = pts_str if '/' in pts_str else int(pts_str)
-                    header_idx = i
-                    break
-
-        # If still not found, try: "name - N" on one line, "pts" on next line
-        if unit_name is None:
-            for i in range(min(4, len(lines) - 1)):
-                if lines[i+1].strip().lower() == "pts":
-                    name_pts_match = re.match(r"^(.+?)\s*-\s*(\d+(?:/\d+)?)\s*$", lines[i])
-                    if name_pts_match:
-                        unit_name = clean_unit_name(norm(name_pts_match.group(1)))
-                        pts_str = name_pts_match.group(2)
-                        points = pts_str if '/' in pts_str else int(pts_str)
-                        header_idx = i + 1
-                        break
+            break  # Highest priority - nothing later can win
+        # Split format: name line, "-" line, "N pts" line
+        if (split3_i is None and i < 3 and i + 2 < n_lines
+                and lines[i+1].strip() == "-" and "pts" in lines[i+2].lower()):
+            pts_match = _PTS_INLINE_RE.search(lines[i+2])
+            if pts_match:
+                split3_i, split3_m = i, pts_match
+        if i < 4 and i + 1 < n_lines:
+            # "- N pts" line (name on the previous line)
+            if dash_pts_i is None and i > 0:
+                m = _DASH_PTS_RE.match(line)
+                if m:
+                    dash_pts_i, dash_pts_m = i, m
+            # "name - N" line with "pts" on the next line
+            if name_pts_i is None and lines[i+1].strip().lower() == "pts":
+                m = _NAME_DASH_PTS_RE.match(line)
+                if m:
+                    name_pts_i, name_pts_m = i, m
+
+    if hm:
+        unit_name = clean_unit_name(norm(hm.group("name")))
+        pts_str = hm.group("pts")
+        # Keep split costs as strings (e.g., "0/20"), convert single values to int
+        points = pts_str if '/' in pts_str else int(pts_str)
+    elif split3_i is not None:
+        unit_name = clean_unit_name(norm(lines[split3_i]))
+        points = int(split3_m.group(1))
+        header_idx = split3_i + 2  # Start looking for statline after pts line
+    elif dash_pts_i is not None:
+        # Previous line should be the name
+        unit_name = clean_unit_name(norm(lines[dash_pts_i - 1]))
+        pts_str = dash_pts_m.group(1)
+        points = pts_str if '/' in pts_str else int(pts_str)
+        header_idx = dash_pts_i
+    elif name_pts_i is not None:
+        unit_name = clean_unit_name(norm(name_pts_m.group(1)))
+        pts_str = name_pts_m.group(2)
+        points = pts_str if '/' in pts_str else int(pts_str)
+        header_idx = name_pts_i + 1
 
     if unit_name is None or points is None:
         return None
@@ -1111,7 +1560,7 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
         # If we have formatting and the line is "Inf", "Vec", or "Air",
         # try combining it with the next line for stat matching
         if not m and has_formatting and i + 1 < len(lines):
-            if re.match(r'^(Inf|Vec|Air)$', lines[i].strip()):
+            if lines[i].strip() in _UNIT_TYPE_TOKENS:
                 combined = lines[i] + lines[i + 1]
                 m = STAT_RE.match(combined)
                 if m:
@@ -1182,11 +1631,45 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
     if stats is None or stat_i is None:
         return None
 
-    # Parse special rules, unit ability, and weapons
+    # The mortar-naming blocks below consult the descriptive category
+    # once per weapon - normalize it a single time here
+    descriptive_category_upper = descriptive_category.upper() if descriptive_category else ""
+    descriptive_category_words = descriptive_category.lower().split() if descriptive_category else []
+    # Derive the mortar type once per card ("Automatic " from "TOWED
+    # AUTOMATIC MORTAR") - it is constant across the card's weapons.
+    # Last non-skipped word wins, matching the old per-weapon loop.
+    mortar_type = ""
+    for word in descriptive_category_words:
+        if word not in _MORTAR_SKIP_WORDS:
+            mortar_type = word
+    mortar_type = mortar_type.title() + " " if mortar_type else ""
+
+    # Parse special rules, unit ability, and weapons. The ability text
+    # is accumulated as a list of parts and joined once at the end -
+    # += on a string reallocates the whole ability per line.
     special_rules: List[str] = []
-    unit_ability: Optional[str] = None
+    unit_ability_parts: List[str] = []
     weapons: List[Dict[str, Any]] = []
 
+    # Lookup tables kept in sync with weapons.append so the ammo-variant
+    # handling below resolves its base weapon with a dict get instead of
+    # a backward scan (with a caliber regex per candidate)
+    name_to_idx: Dict[str, int] = {}
+    caliber_to_last_idx: Dict[str, int] = {}
+    last_base_idx: Optional[int] = None
+
+    def _index_last_weapon() -> None:
+        nonlocal last_base_idx
+        idx = len(weapons) - 1
+        name = weapons[idx]["name"]
+        name_to_idx[name] = idx
+        # Ammo variants are never base-weapon candidates
+        if not name.startswith(">"):
+            last_base_idx = idx
+            caliber_m = _CALIBER_RE.search(name)
+            if caliber_m:
+                caliber_to_last_idx[caliber_m.group(1)] = idx
+
     # Debug flag for GRENADIERS (disabled)
     is_grenadiers = False  # 'GRENADIER' in unit_name.upper()
     # if is_grenadiers:
@@ -1195,24 +1678,22 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
     #     for i in range(min(len(lines), len(line_boxes))):
     #         print(f"  {i:2d} | italic={line_boxes[i].is_italic} | '{lines[i][:80]}'")
 
-    def is_weapon_line(ln: str, idx: int = -1) -> bool:
-        """Check if a line is a weapon name"""
-        matches_pattern = bool(WEAPON_NAME_RE.match(ln))
-        # If we have formatting info, make sure it's NOT italic (italic = special rule)
-        if idx >= 0 and idx < len(line_boxes):
-            is_italic = line_boxes[idx].is_italic
-            # Weapon names should NOT be italic
-            return matches_pattern and not is_italic
-        return matches_pattern
-
-    def is_special_rule_line(idx: int) -> bool:
-        """Check if a line is a special rule - special rules are italic in the PDF"""
-        if idx < 0 or idx >= len(line_boxes):
-            return False
-        result = line_boxes[idx].is_italic
-        # if is_grenadiers and idx >= 3 and idx <= 8:
-        #     print(f"    is_special_rule_line({idx}): line_boxes[{idx}].text='{line_boxes[idx].text[:40]}', is_italic={line_boxes[idx].is_italic}, returning {result}")
-        return result
+    # The heuristic merging above only runs without formatting info (all
+    # flags False), but it can shorten `lines`; re-align the flag list so
+    # every index below is in bounds without per-access length checks
+    if len(italics) != len(lines):
+        italics = (italics + [False] * (len(lines) - len(italics)))[:len(lines)]
+
+    def _classify_weapon_lines() -> List[bool]:
+        """Per-line weapon-name flags: matches WEAPON_NAME_RE and is
+        not italic (italic = special rule)"""
+        return [bool(WEAPON_NAME_RE.match(t)) and not it
+                for t, it in zip(lines, italics)]
+
+    # Classify every line once instead of re-running WEAPON_NAME_RE in
+    # the loop conditions below (recomputed after the italic-split pass
+    # mutates lines)
+    is_weapon = _classify_weapon_lines()
 
     # Collect special rules (italic lines) and unit ability (if present)
     # Card structure after stats:
@@ -1223,7 +1704,7 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
 
     # If we have formatting and the stat line was split (Inf on one line, rest on next),
     # we need to skip the second part of the stat line
-    if has_formatting and re.match(r'^(Inf|Vec|Air)$', lines[stat_i].strip()):
+    if has_formatting and lines[stat_i].strip() in _UNIT_TYPE_TOKENS:
         # Stat line is split - skip the next line (which has the rest of the stats)
         cursor = stat_i + 2
 
@@ -1232,33 +1713,30 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
     in_comma_separated_rules = False
     ability_started = False
 
-    while cursor < len(lines) and not is_weapon_line(lines[cursor], cursor):
+    while cursor < len(lines) and not is_weapon[cursor]:
         # Check for separator (underscore line)
-        if re.match(r'^_+$', lines[cursor].strip()):
+        if _is_separator(lines[cursor]):
             cursor += 1
             continue  # Skip separators but keep processing
 
-        ln = lines[cursor].strip("_").strip()
+        ln = lines[cursor].strip("_ \t")
         if not ln:
             cursor += 1
             continue
 
-        # Only process italic lines in this section
-        if is_special_rule_line(cursor):
+        # Only process italic lines in this section - special rules are
+        # italic in the PDF
+        if italics[cursor]:
             # Check if unit ability has already started
             if ability_started:
                 # We're in ability mode - add to unit ability
-                if unit_ability is None:
-                    unit_ability = ln
-                else:
-                    unit_ability += ' ' + ln
+                unit_ability_parts.append(ln)
                 cursor += 1
                 continue
 
             # Check if this line starts a unit ability (sentence form)
             # Heuristics: starts with common sentence words
-            sentence_starters = ['All', 'The', 'Each', 'When', 'If', 'Any', 'This', 'Target', 'Units']
-            starts_sentence = any(ln.startswith(word + ' ') for word in sentence_starters)
+            starts_sentence = ln.startswith(_SENTENCE_STARTER_PREFIXES)
 
             # Or ends with period (likely end of ability sentence)
             ends_with_period = ln.endswith('.')
@@ -1270,7 +1748,7 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
             if starts_sentence or (looks_like_ability and not in_comma_separated_rules):
                 # This starts the unit ability section
                 ability_started = True
-                unit_ability = ln
+                unit_ability_parts = [ln]
                 cursor += 1
                 continue
 
@@ -1293,10 +1771,12 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                 else:
                     # Long phrase without comma - might be unit ability that was missed
                     ability_started = True
-                    unit_ability = ln
+                    unit_ability_parts = [ln]
 
         cursor += 1
 
+    unit_ability: Optional[str] = ' '.join(unit_ability_parts) if unit_ability_parts else None
+
     # if is_grenadiers:
     #     print(f"DEBUG: After special rules loop, cursor={cursor}, special_rules={special_rules}, unit_ability={unit_ability}")
 
@@ -1304,41 +1784,50 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
     # This happens when fuzzy matching combines "Defensive CC" (italic) with "6L1 85mm RPG" (non-italic)
     # We need to split such lines and update both `lines` and `line_boxes`
     # Look for italic lines that contain a weapon code pattern (alphanumeric code with at least one digit)
-    # Pattern to find weapon code: starts with digit or letter, contains at least one digit
-    weapon_code_pattern = re.compile(r'(?=\S*\d)[0-9A-Z][0-9A-Z\-]*\s+\S+')
-
-    fixed_lines = []
-    fixed_line_boxes = []
-    for i, (line, line_box) in enumerate(zip(lines, line_boxes)):
-        if line_box.is_italic:
-            # Check if this line contains a weapon code
-            code_match = weapon_code_pattern.search(line)
-            if code_match:
-                weapon_name_start = code_match.start()
-                if weapon_name_start > 0:
-                    # Split: text before weapon code is special rule (italic),
-                    # weapon code and after is weapon (should be non-italic but we'll mark as such)
-                    special_rule_part = line[:weapon_name_start].strip()
-                    weapon_part = line[weapon_name_start:].strip()
-                    if special_rule_part and weapon_part:
-                        # Add the split parts
-                        fixed_lines.append(special_rule_part)
-                        fixed_line_boxes.append(LineBox(text=special_rule_part, is_italic=True, is_bold=False))
-                        fixed_lines.append(weapon_part)
-                        # Mark weapon part as non-italic even though it came from an italic line
-                        fixed_line_boxes.append(LineBox(text=weapon_part, is_italic=False, is_bold=False))
-                        continue
-        # No split needed, keep line as-is
-        fixed_lines.append(line)
-        fixed_line_boxes.append(line_box)
-
-    # Replace with fixed versions
-    lines = fixed_lines
-    line_boxes = fixed_line_boxes
+
+    # Without any italic annotations nothing can need splitting -
+    # skip the traversal and list rebuilds outright
+    if has_formatting:
+        fixed_lines = []
+        fixed_italics = []
+        for line, is_italic in zip(lines, italics):
+            # Weapon codes always contain a digit, and most italic lines
+            # are pure prose - skip the lookahead regex for those
+            if is_italic and len(line.translate(_DIGIT_DEL_TRANS)) != len(line):
+                # Check if this line contains a weapon code
+                code_match = _WEAPON_CODE_RE.search(line)
+                if code_match:
+                    weapon_name_start = code_match.start()
+                    if weapon_name_start > 0:
+                        # Split: text before weapon code is special rule (italic),
+                        # weapon code and after is weapon (should be non-italic but we'll mark as such)
+                        special_rule_part = line[:weapon_name_start].strip()
+                        weapon_part = line[weapon_name_start:].strip()
+                        if special_rule_part and weapon_part:
+                            # Add the split parts
+                            fixed_lines.append(special_rule_part)
+                            fixed_italics.append(True)
+                            fixed_lines.append(weapon_part)
+                            # Mark weapon part as non-italic even though it came from an italic line
+                            fixed_italics.append(False)
+                            continue
+            # No split needed, keep line as-is
+            fixed_lines.append(line)
+            fixed_italics.append(is_italic)
+
+        # Replace with fixed versions (the closures above see the rebound
+        # `italics` through the shared cell) and refresh the weapon flags
+        # for the new line indices
+        lines = fixed_lines
+        italics = fixed_italics
+        is_weapon = _classify_weapon_lines()
 
     # Parse weapons (non-italic lines matching weapon pattern, followed by profiles)
     while cursor < len(lines):
         ln = lines[cursor]
+        # Special rules lifted out of the weapon name; reset per weapon so
+        # the unnamed-profile path never sees a previous weapon's leftovers
+        embedded_special_rules: List[str] = []
 
         # Clean up lines that have special rules prefixed to ammunition variants
         # Example: "Radius (2\") > 82mm Chemical-SP" -> "> 82mm Chemical-SP"
@@ -1360,7 +1849,7 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
         wm = WEAPON_NAME_RE.match(cleaned_ln)
 
         # Use formatting to help identify weapon names - they should NOT be italic
-        is_italic_line = cursor < len(line_boxes) and line_boxes[cursor].is_italic
+        is_italic_line = italics[cursor]
 
 
         # Check if this line is a weapon profile without a name (secondary weapons)
@@ -1408,25 +1897,19 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                     while next_cursor < len(lines):
                         next_ln = lines[next_cursor].strip()
                         # Skip empty lines and separators
-                        if not next_ln or re.match(r'^_+$', next_ln):
+                        if not next_ln or _is_separator(next_ln):
                             next_cursor += 1
                             continue
                         # Check if next line is an ammunition variant (starts with ">")
                         if next_ln.startswith(">"):
                             # Extract caliber from ammunition name (e.g., "> 82mm Frag" -> "82mm")
-                            caliber_match = re.search(r'(\d+mm)', next_ln)
+                            caliber_match = _CALIBER_RE.search(next_ln)
                             if caliber_match:
                                 caliber = caliber_match.group(1)
                                 # Name based on unit's descriptive category if available
                                 # "TOWED AUTOMATIC MORTAR" -> "82mm Automatic Mortar"
                                 # Otherwise just "82mm Mortar"
-                                if descriptive_category and "MORTAR" in descriptive_category.upper():
-                                    # Extract type (e.g., "Automatic" from "TOWED AUTOMATIC MORTAR")
-                                    desc_words = descriptive_category.lower().split()
-                                    mortar_type = ""
-                                    for word in desc_words:
-                                        if word not in ["towed", "mortar", "self-propelled"]:
-                                            mortar_type = word.title() + " "
+                                if "MORTAR" in descriptive_category_upper:
                                     weapon_title = f"{caliber} {mortar_type}Mortar"
                                 else:
                                     weapon_title = f"{caliber} Mortar"
@@ -1436,6 +1919,14 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                         if PROFILE_DETECT_RE.search(next_ln):
                             break
                         next_cursor += 1
+
+                # Cache the base/variant split the same way the named-weapon
+                # branch does, so the shotType handling below reuses it
+                if '>' in weapon_title and not weapon_title.startswith('>'):
+                    base_name, _, variant_name = weapon_title.partition('>')
+                    variant_split = (base_name.strip(), variant_name.strip())
+                else:
+                    variant_split = None
             else:
                 cursor += 1
                 continue
@@ -1449,37 +1940,39 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
             # "2K52 152mm Howitzer Ammo 3 No CC > 152mm HEAT" -> keep "> 152mm HEAT", extract "No CC", remove "Ammo 3"
             # "Ammo 6 Turret 2K15 40mm HE Grenade Launcher" -> extract "Turret", remove "Ammo 6"
 
-            # Track special rules found in the weapon name that should be added later
-            embedded_special_rules = []
-
             # Extract and remove "Ammo X" patterns from anywhere in the name
             # The ammo value will be parsed from the profile line later
-            weapon_title = re.sub(r'\s*Ammo\s+\d+\s*', ' ', weapon_title, flags=re.IGNORECASE)
+            if 'ammo' in weapon_title.lower():
+                weapon_title = _AMMO_SUB_RE.sub(' ', weapon_title)
 
             # Extract special rules that appear BEFORE the ">" marker (if any)
             # Split on ">" to handle base weapon vs ammo variant separately
             if '>' in weapon_title and not weapon_title.startswith('>'):
                 parts = weapon_title.split('>', 1)
                 base_part = parts[0].strip()
-                ammo_part = '>' + parts[1].strip()
+                ammo_variant_name = ' '.join(parts[1].split())
 
                 # Extract special rules from the base part only
-                for rule in ['Turret', 'No CC', 'Multi-Gun']:
-                    if re.search(r'\b' + rule + r'\b', base_part):
+                for rule, rule_search, rule_strip in _EMBEDDED_RULE_PATTERNS:
+                    if rule_search.search(base_part):
                         embedded_special_rules.append(rule)
-                        base_part = re.sub(r'\s*\b' + rule + r'\b\s*', ' ', base_part)
+                        base_part = rule_strip.sub(' ', base_part)
 
-                # Reconstruct: cleaned base + ammo variant
-                weapon_title = base_part.strip() + ' ' + ammo_part
+                # Reconstruct: cleaned base + ammo variant; keep the split
+                # so the shotType branch below doesn't re-scan the title
+                base_part = ' '.join(base_part.split())
+                weapon_title = (base_part + ' >' + ammo_variant_name).strip()
+                variant_split = (base_part, ammo_variant_name) if base_part else None
             else:
                 # No ">" marker - extract special rules from entire name
-                for rule in ['Turret', 'No CC', 'Multi-Gun']:
-                    if re.search(r'\b' + rule + r'\b', weapon_title):
+                for rule, rule_search, rule_strip in _EMBEDDED_RULE_PATTERNS:
+                    if rule_search.search(weapon_title):
                         embedded_special_rules.append(rule)
-                        weapon_title = re.sub(r'\s*\b' + rule + r'\b\s*', ' ', weapon_title)
+                        weapon_title = rule_strip.sub(' ', weapon_title)
 
-            # Clean up multiple spaces
-            weapon_title = re.sub(r'\s+', ' ', weapon_title).strip()
+                # Clean up multiple spaces
+                weapon_title = ' '.join(weapon_title.split())
+                variant_split = None
 
             cursor += 1
             if cursor >= len(lines):
@@ -1499,31 +1992,45 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
             cursor += 1
             continue
 
-        pg = pm.groupdict()
+        # Bind the named groups to locals once instead of building a
+        # groupdict and hashing a key per access below
+        pg_target, pg_range, pg_acc, pg_str, pg_dmg, pg_ammo, pg_trailing = pm.group(
+            "target", "range", "acc", "str", "dmg", "ammo", "trailing"
+        )
         cursor += 1
 
         # Extract trailing special rules from the profile line itself
         w_rules: List[str] = []
-        if pg.get("trailing") and pg["trailing"].strip():
-            trailing_rules = split_rules_smart(pg["trailing"])
+        if pg_trailing and pg_trailing.strip():
+            trailing_rules = split_rules_smart(pg_trailing)
             w_rules.extend(trailing_rules)
 
         # Collect special rules after the profile
         # Also look for standalone "Ammo X" lines and extract ammo value
         ammo_from_line = None
-        while cursor < len(lines) and not is_weapon_line(lines[cursor], cursor):
-            rule_ln = lines[cursor].strip("_").strip()
-            is_italic_line = cursor < len(line_boxes) and line_boxes[cursor].is_italic
-
-            # Check if this is an "Ammo X" line (weapon stat, not a special rule)
-            ammo_match = re.match(r'^Ammo\s+(\d+)$', rule_ln, re.IGNORECASE)
-            if ammo_match:
-                ammo_from_line = int(ammo_match.group(1))
+        while cursor < len(lines) and not is_weapon[cursor]:
+            rule_ln = lines[cursor].strip("_ \t")
+            is_italic_line = italics[cursor]
+
+            # Classify the line once: empty, "Ammo X" stat line, or
+            # weapon profile - instead of re-running each regex per
+            # branch below
+            if not rule_ln:
                 cursor += 1
                 continue
 
+            # Check if this is an "Ammo X" line (weapon stat, not a special rule)
+            if rule_ln[:4].lower() == 'ammo':
+                ammo_match = _AMMO_LINE_RE.match(rule_ln)
+                if ammo_match:
+                    ammo_from_line = int(ammo_match.group(1))
+                    cursor += 1
+                    continue
+
+            is_profile = PROFILE_DETECT_RE.search(rule_ln) is not None
+
             # Don't add lines that look like weapon profiles to special rules
-            if rule_ln and not PROFILE_DETECT_RE.search(rule_ln):
+            if not is_profile:
                 # Check if this line is an ammunition variant (starts with ">")
                 # If so, don't add as a special rule - it will be handled separately
                 if rule_ln.startswith(">") and WEAPON_NAME_RE.match(rule_ln):
@@ -1541,24 +2048,17 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                             continue
                         w_rules.append(part)
                 cursor += 1
-            elif PROFILE_DETECT_RE.search(rule_ln):
+            else:
                 # This is another weapon profile, stop collecting rules
                 break
-            else:
-                cursor += 1
 
         # Parse weapon stats - skip if required fields are invalid
         # Handle range O -> 0 and OCR errors
-        range_val = pg["range"]
-        if range_val == "O" or range_val.lower() == "o":
-            range_val = "0"
-        elif range_val.lower() == "e" or range_val.lower() == "eo":
-            range_val = "40"  # Common OCR error: 40 -> e or eo
-        elif range_val.lower() == "4o":
-            range_val = "40"  # Common OCR error: 40 -> 4o
+        range_val = pg_range
+        range_val = _RANGE_OCR_FIXUPS.get(range_val.lower(), range_val)
 
-        accuracy = parse_acc(pg["acc"])
-        strength = parse_strength(pg["str"]) if pg.get("str") else None
+        accuracy = parse_acc(pg_acc)
+        strength = parse_strength(pg_str) if pg_str else None
 
         # Skip weapon if accuracy couldn't be parsed (bad OCR)
         if accuracy is None:
@@ -1566,10 +2066,10 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
 
         weapon_obj = {
             "name": weapon_title,
-            "target": pg["target"].replace(" ", "") if pg.get("target") else "All",  # Default to All if missing
+            "target": pg_target.replace(" ", "") if pg_target else "All",  # Default to All if missing
             "range": int(range_val),
             "accuracy": accuracy,
-            "dice": int(pg["dmg"]),
+            "dice": int(pg_dmg),
         }
 
         # Add strength only if present (some weapons like MGs don't have variable strength)
@@ -1577,8 +2077,8 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
             weapon_obj["strength"] = strength
 
         # Use ammo from profile, or from standalone "Ammo X" line, or None
-        if pg.get("ammo"):
-            weapon_obj["ammo"] = int(pg["ammo"])
+        if pg_ammo:
+            weapon_obj["ammo"] = int(pg_ammo)
         elif ammo_from_line is not None:
             weapon_obj["ammo"] = ammo_from_line
         else:
@@ -1586,51 +2086,39 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
 
         # If weapon is still unnamed and w_rules contains ammunition variants, use them to name it
         if weapon_title == "(Unnamed weapon)" and w_rules:
-            for rule in w_rules[:]:  # Iterate over a copy so we can remove items
+            for rule_idx, rule in enumerate(w_rules):  # Loop breaks after any removal
                 if rule.startswith(">"):
-                    caliber_match = re.search(r'(\d+mm)', rule)
+                    caliber_match = _CALIBER_RE.search(rule)
                     if caliber_match:
                         caliber = caliber_match.group(1)
                         # Name based on unit's descriptive category if available
-                        if descriptive_category and "MORTAR" in descriptive_category.upper():
-                            # Extract type (e.g., "Automatic" from "TOWED AUTOMATIC MORTAR")
-                            desc_words = descriptive_category.lower().split()
-                            mortar_type = ""
-                            for word in desc_words:
-                                if word not in ["towed", "mortar", "self-propelled"]:
-                                    mortar_type = word.title() + " "
+                        if "MORTAR" in descriptive_category_upper:
                             weapon_title = f"{caliber} {mortar_type}Mortar"
                         else:
                             weapon_title = f"{caliber} Mortar"
                         # Update the weapon object name
                         weapon_obj["name"] = weapon_title
                         # Remove the ammo variant from w_rules since it's not a special rule
-                        w_rules.remove(rule)
+                        del w_rules[rule_idx]
                         break
 
         # Add any embedded special rules that were extracted from the weapon name
-        if 'embedded_special_rules' in locals() and embedded_special_rules:
+        if embedded_special_rules:
             w_rules = embedded_special_rules + w_rules
 
         if w_rules:
             # Merge fragmented rules before deduping
             merged_w_rules = merge_fragmented_rules(w_rules)
-            weapon_obj["specialRules"] = dedupe_preserve_order(merged_w_rules)
+            weapon_obj["specialRules"] = list(dict.fromkeys(merged_w_rules))
 
         # Check if weapon name contains both base weapon and ammo variant (e.g., "2K52 152mm Howitzer > 152mm HEAT")
         # If so, split into base weapon and add this profile as a shotType
-        if '>' in weapon_title and not weapon_title.startswith('>'):
-            # Split base weapon from ammo variant
-            parts = weapon_title.split('>', 1)
-            base_weapon_name = parts[0].strip()
-            ammo_variant_name = parts[1].strip()
+        if variant_split is not None:
+            # Base weapon / ammo variant pair cached when the title was formed
+            base_weapon_name, ammo_variant_name = variant_split
 
             # Check if we already have this base weapon
-            base_weapon_idx = None
-            for i in range(len(weapons) - 1, -1, -1):
-                if weapons[i]["name"] == base_weapon_name:
-                    base_weapon_idx = i
-                    break
+            base_weapon_idx = name_to_idx.get(base_weapon_name)
 
             # If base weapon doesn't exist, create it as a placeholder with minimal info
             if base_weapon_idx is None:
@@ -1650,15 +2138,19 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                     base_weapon["specialRules"] = weapon_obj["specialRules"]
 
                 weapons.append(base_weapon)
+                _index_last_weapon()
                 base_weapon_idx = len(weapons) - 1
 
             base_weapon = weapons[base_weapon_idx]
 
-            # Add this profile as a shotType to the base weapon
-            shot_type = {"name": ammo_variant_name}
-            shot_type["target"] = weapon_obj["target"]
-            shot_type["range"] = weapon_obj["range"]
-            shot_type["accuracy"] = weapon_obj["accuracy"]
+            # Add this profile as a shotType to the base weapon (one dict
+            # literal; strength slots in before dice to keep key order)
+            shot_type = {
+                "name": ammo_variant_name,
+                "target": weapon_obj["target"],
+                "range": weapon_obj["range"],
+                "accuracy": weapon_obj["accuracy"],
+            }
             if weapon_obj.get("strength") is not None:
                 shot_type["strength"] = weapon_obj["strength"]
             shot_type["dice"] = weapon_obj["dice"]
@@ -1666,27 +2158,10 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                 shot_type["specialRules"] = weapon_obj["specialRules"]
 
                 # Fix special rules for Smoke and Chemical-SP ammunition
-                # These often have the ammo type in the name and just the radius in special rules
-                # e.g., name "82mm Smoke" with specialRule "(3)" should be "Smoke (3\")"
-                if ammo_variant_name.endswith("Smoke") or ammo_variant_name.endswith("Chemical-SP"):
-                    fixed_rules = []
-                    ammo_type = ammo_variant_name.split()[-1]  # Get "Smoke" or "Chemical-SP"
-
-                    for rule in shot_type["specialRules"]:
-                        # Check if this is an orphaned radius marker like "(3)" or "(4\")"
-                        if re.match(r'^\([0-9]+"?\)$', rule):
-                            # Reconstruct: "Smoke (3\")" or "Chemical-SP (3\")"
-                            # Ensure proper quote formatting
-                            if '"' not in rule and ')' in rule:
-                                # Add missing quote: "(3)" -> "(3\")"
-                                radius = rule.replace(')', '\")')
-                            else:
-                                radius = rule
-                            fixed_rules.append(f"{ammo_type} {radius}")
-                        else:
-                            fixed_rules.append(rule)
-
-                    shot_type["specialRules"] = fixed_rules
+                if ammo_variant_name.endswith(("Smoke", "Chemical-SP")):
+                    shot_type["specialRules"] = _fix_smoke_chem_rules(
+                        shot_type["specialRules"], ammo_variant_name.rsplit(" ", 1)[-1]
+                    )
 
             if "shotTypes" not in base_weapon:
                 base_weapon["shotTypes"] = []
@@ -1701,31 +2176,16 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
 
         if is_ammo_variant and weapons:
             # This is an ammunition variant - add as shotType to the base weapon
-            # Find the base weapon: walk backwards to find a weapon that matches caliber/type
-            base_weapon_idx = None
-
             # Extract caliber from ammunition name (e.g., "> 152mm HEAT" -> "152mm")
-            ammo_caliber_match = re.search(r'(\d+mm)', weapon_title)
+            ammo_caliber_match = _CALIBER_RE.search(weapon_title)
             ammo_caliber = ammo_caliber_match.group(1) if ammo_caliber_match else None
 
-            # Walk backwards to find matching base weapon
-            for i in range(len(weapons) - 1, -1, -1):
-                weapon_name = weapons[i]["name"]
-
-                # Skip other ammunition variants
-                if weapon_name.startswith(">"):
-                    continue
-
-                # Check if this weapon's caliber matches the ammo caliber
-                if ammo_caliber:
-                    weapon_caliber_match = re.search(r'(\d+mm)', weapon_name)
-                    if weapon_caliber_match and weapon_caliber_match.group(1) == ammo_caliber:
-                        base_weapon_idx = i
-                        break
-                else:
-                    # No caliber found in ammo name - use most recent non-ammo weapon
-                    base_weapon_idx = i
-                    break
+            # Base weapon: most recent weapon with the same caliber, or the
+            # most recent non-ammo weapon if the variant names no caliber
+            if ammo_caliber:
+                base_weapon_idx = caliber_to_last_idx.get(ammo_caliber)
+            else:
+                base_weapon_idx = last_base_idx
 
             # If no matching base weapon found, skip this ammunition variant
             if base_weapon_idx is None:
@@ -1737,17 +2197,17 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
             # Extract the shot type name (remove the ">" prefix)
             shot_name = weapon_title[1:].strip()
 
-            # Create shot type object with all properties (shotTypes can have completely different stats)
-            shot_type = {"name": shot_name}
-
-            # Always include all stats for shot types since they can be completely different
-            shot_type["target"] = weapon_obj["target"]
-            shot_type["range"] = weapon_obj["range"]
-            shot_type["accuracy"] = weapon_obj["accuracy"]
-
+            # Create shot type object with all properties (shotTypes can
+            # have completely different stats). One dict literal; strength
+            # slots in before dice to keep key order.
+            shot_type = {
+                "name": shot_name,
+                "target": weapon_obj["target"],
+                "range": weapon_obj["range"],
+                "accuracy": weapon_obj["accuracy"],
+            }
             if weapon_obj.get("strength") is not None:
                 shot_type["strength"] = weapon_obj["strength"]
-
             shot_type["dice"] = weapon_obj["dice"]
 
             # Shot-specific special rules
@@ -1755,27 +2215,10 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
                 shot_type["specialRules"] = weapon_obj["specialRules"]
 
                 # Fix special rules for Smoke and Chemical-SP ammunition
-                # These often have the ammo type in the name and just the radius in special rules
-                # e.g., name "82mm Smoke" with specialRule "(3)" should be "Smoke (3\")"
-                if shot_name.endswith("Smoke") or shot_name.endswith("Chemical-SP"):
-                    fixed_rules = []
-                    ammo_type = shot_name.split()[-1]  # Get "Smoke" or "Chemical-SP"
-
-                    for rule in shot_type["specialRules"]:
-                        # Check if this is an orphaned radius marker like "(3)" or "(4\")"
-                        if re.match(r'^\([0-9]+"?\)$', rule):
-                            # Reconstruct: "Smoke (3\")" or "Chemical-SP (3)"
-                            # Ensure proper quote formatting
-                            if '"' not in rule and ')' in rule:
-                                # Add missing quote: "(3)" -> "(3\")"
-                                radius = rule.replace(')', '\")')
-                            else:
-                                radius = rule
-                            fixed_rules.append(f"{ammo_type} {radius}")
-                        else:
-                            fixed_rules.append(rule)
-
-                    shot_type["specialRules"] = fixed_rules
+                if shot_name.endswith(("Smoke", "Chemical-SP")):
+                    shot_type["specialRules"] = _fix_smoke_chem_rules(
+                        shot_type["specialRules"], shot_name.rsplit(" ", 1)[-1]
+                    )
 
             # Initialize shotTypes array if not present
             if "shotTypes" not in base_weapon:
@@ -1785,6 +2228,7 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
         else:
             # Regular weapon or first weapon - add to weapons list
             weapons.append(weapon_obj)
+            _index_last_weapon()
 
     # Use unit_type for unitClass (for PC capacity calculations)
     unit_class = unit_type
@@ -1803,7 +2247,7 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
 
     # Merge fragmented rules before deduping
     merged_rules = merge_fragmented_rules(special_rules) if special_rules else []
-    deduped_rules = dedupe_preserve_order(merged_rules)
+    deduped_rules = list(dict.fromkeys(merged_rules))
     unit["specialRules"] = [{"name": r} for r in deduped_rules]
 
     # Add unit ability if we captured it
@@ -1821,6 +2265,12 @@ def parse_card_text(card_text: str, line_boxes: Optional[List[LineBox]] = None)
 # -----------------------------
 # Main extraction with OCR
 # -----------------------------
+def _init_ocr_worker():
+    """Keep each worker's Tesseract single-threaded; parallelism comes
+    from the process pool itself."""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+
+
 def extract_units_from_qur_ocr(
     pdf_path: str,
     dpi: int = 300,
@@ -1837,12 +2287,15 @@ def extract_units_from_qur_ocr(
 
         print(f"Found {len(qur_pages)} QUR pages: {qur_pages}")
 
+        # First pass: collect headings and card boxes per page so all
+        # render+OCR jobs are known up front
+        page_headings: Dict[int, List] = {}
+        jobs: List[Tuple[int, List[Tuple[float, float, float, float]]]] = []
         for pno in qur_pages:
-            print(f"Processing page {pno}...")
             page = pdf.pages[pno]
 
             # Extract headings for category/subcategory
-            headings = extract_headings(page)
+            page_headings[pno] = extract_headings(page)
 
             # Get card bounding boxes
             card_bboxes = extract_card_bboxes_from_page(page)
@@ -1851,68 +2304,86 @@ def extract_units_from_qur_ocr(
                 print(f"  Warning: No card boxes found on page {pno}, skipping")
                 continue
 
-            print(f"  Found {len(card_bboxes)} cards")
-
-            for i, bbox in enumerate(card_bboxes):
-                print(f"    Extracting card {i+1}...")
+            print(f"  Page {pno}: found {len(card_bboxes)} cards")
+            jobs.append((pno, card_bboxes))
+
+        # OCR pages in parallel - render+OCR is the dominant cost and
+        # each page is independent. One Tesseract call covers all cards
+        # on a page via a composite image. The pdfplumber formatting
+        # pass stays in this process (pages aren't picklable).
+        print(f"OCR'ing {len(jobs)} pages across {os.cpu_count()} workers...")
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_ocr_worker) as executor:
+            futures = [
+                executor.submit(ocr_page_cards, pdf_path, pno, bboxes, dpi, debug, debug_path)
+                for pno, bboxes in jobs
+            ]
+            ocr_results = [f.result() for f in futures]
+
+        card_items = [
+            (pno, bbox, ocr_lines)
+            for (pno, bboxes), page_lines in zip(jobs, ocr_results)
+            for bbox, ocr_lines in zip(bboxes, page_lines)
+        ]
+
+        current_page = None
+        for pno, bbox, ocr_lines in card_items:
+            if pno != current_page:
+                print(f"Processing page {pno}...")
+                current_page = pno
+            page = pdf.pages[pno]
+            headings = page_headings[pno]
 
-                # Extract text using OCR with formatting
-                text, line_boxes = extract_card_text_ocr(pdf_path, pno, page, bbox, dpi=dpi, debug=debug, debug_path=debug_path)
+            # Match OCR lines to PDF formatting
+            text, line_boxes = extract_card_text_ocr(
+                pdf_path, pno, page, bbox, dpi=dpi, debug=debug,
+                debug_path=debug_path, ocr_lines=ocr_lines
+            )
 
-                if not text:
-                    print(f"      No text extracted")
-                    continue
+            if not text:
+                print(f"      No text extracted")
+                continue
 
-                # Parse card with formatting information
-                unit = parse_card_text(text, line_boxes)
-                if not unit:
-                    print(f"      Failed to parse card")
-                    # Print ALL lines for debugging
-                    lines = text.split('\n')
-                    for ln in lines:
-                        print(f"        {repr(ln)}")
-                    continue
+            # Parse card with formatting information
+            unit = parse_card_text(text, line_boxes)
+            if not unit:
+                print(f"      Failed to parse card")
+                # Print ALL lines for debugging
+                lines = text.split('\n')
+                for ln in lines:
+                    print(f"        {repr(ln)}")
+                continue
 
-                # Add category/subcategory
-                heading = heading_for_card(headings, bbox)
-                cat, subcat = split_category_subcategory(heading)
-
-                # Always infer category from unitClass to ensure consistency
-                # This is more reliable than heading detection which can pick up wrong headers
-                unit_class_value = unit["unitClass"]
-                if "Inf" in unit_class_value:
-                    inferred_cat = "Infantry"
-                elif "Vec" in unit_class_value:
-                    inferred_cat = "Vehicles"
-                elif "Air" in unit_class_value:
-                    inferred_cat = "Aircraft"
-                else:
-                    inferred_cat = "Infantry"
-
-                # Verify heading-based category matches unitClass, otherwise use inferred
-                valid_categories = ['TACOMS', 'Infantry', 'Vehicles', 'Aircraft', 'Emplacements', 'Support', 'Scenario']
-                if cat and cat in valid_categories:
-                    # Check if it matches the unit class
-                    if (cat == "Infantry" and "Inf" in unit_class_value) or \
-                       (cat == "Vehicles" and "Vec" in unit_class_value) or \
-                       (cat == "Aircraft" and "Air" in unit_class_value) or \
-                       cat in ['TACOMS', 'Emplacements', 'Support', 'Scenario']:
-                        # Category matches unit class, keep it
-                        pass
-                    else:
-                        # Category doesn't match unit class, use inferred
-                        cat = inferred_cat
-                        subcat = None  # Clear subcategory since heading was wrong
-                else:
-                    # Invalid or missing category, use inferred
+            # Add category/subcategory
+            heading = heading_for_card(headings, bbox)
+            cat, subcat = split_category_subcategory(heading)
+
+            # Always infer category from unitClass to ensure consistency
+            # This is more reliable than heading detection which can pick up wrong headers
+            unit_class_value = unit["unitClass"]
+            inferred_cat = next(
+                (c for sub, c in _CLASS_TO_CAT if sub in unit_class_value),
+                "Infantry"
+            )
+
+            # Verify heading-based category matches unitClass, otherwise use inferred
+            if cat and cat in _VALID_CATEGORIES:
+                # Check if it matches the unit class
+                class_prefix = _CAT_TO_CLASS.get(cat)
+                if not (cat in _CLASSLESS_CATEGORIES or
+                        (class_prefix and class_prefix in unit_class_value)):
+                    # Category doesn't match unit class, use inferred
                     cat = inferred_cat
+                    subcat = None  # Clear subcategory since heading was wrong
+            else:
+                # Invalid or missing category, use inferred
+                cat = inferred_cat
 
-                unit["category"] = cat
-                if subcat:
-                    unit["subcategory"] = subcat
+            unit["category"] = cat
+            if subcat:
+                unit["subcategory"] = subcat
 
-                print(f"      Parsed: {unit['name']}")
-                units.append(unit)
+            print(f"      Parsed: {unit['name']}")
+            units.append(unit)
 
     # De-dupe by unit id
     out: List[Dict[str, Any]] = []
@@ -1992,8 +2463,14 @@ def main() -> int:
         validate_against_schema(roster, args.schema)
         print("Validation passed!")
 
-    with open(args.out, "w", encoding="utf-8") as f:
-        json.dump(roster, f, indent=2, ensure_ascii=False)
+    # orjson serializes the whole roster at C level in one buffer;
+    # json.dump issues one small write per token
+    if orjson is not None:
+        with open(args.out, "wb") as f:
+            f.write(orjson.dumps(roster, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(json.dumps(roster, indent=2, ensure_ascii=False))
 
     print(f"✓ Wrote {len(roster['units'])} units to {args.out}")
     return 0
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Regression tests for the ijson streaming path in convert_special_rules.
+
+Run with: python scripts/test_convert_special_rules.py
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+import convert_special_rules as csr
+
+
+@unittest.skipIf(csr.ijson is None, "ijson not installed")
+class StreamConvertFileTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        self.json_file = Path(self._tmpdir.name) / 'faction.json'
+
+    def _write_faction(self, units):
+        payload = {'faction': {'name': 'Test Faction', 'version': 1.2}, 'units': units}
+        self.json_file.write_text(json.dumps(payload, indent=2))
+
+    def test_floats_survive_the_streaming_path(self):
+        # Fractional numbers used to arrive from ijson as Decimal and
+        # crash json.dumps mid-write on exactly the large files the
+        # streaming path exists for
+        self._write_faction([
+            {'name': 'Rifles', 'cost': 12.5,
+             'specialRules': [{'name': 'Smoke'}]},
+        ])
+        name, changed = csr.stream_convert_file(self.json_file)
+        self.assertTrue(changed)
+        data = json.loads(self.json_file.read_text())
+        self.assertEqual(data['faction']['version'], 1.2)
+        self.assertEqual(data['units'][0]['cost'], 12.5)
+        self.assertEqual(data['units'][0]['specialRules'], ['Smoke'])
+        self.assertFalse(self.json_file.with_suffix('.json.tmp').exists())
+
+    def test_process_file_streams_floats_above_threshold(self):
+        self._write_faction([
+            {'name': 'Rifles', 'cost': 12.5,
+             'specialRules': [{'name': 'Smoke'}]},
+        ])
+        original = csr.STREAM_THRESHOLD
+        csr.STREAM_THRESHOLD = 0
+        try:
+            name, changed = csr.process_file(self.json_file)
+        finally:
+            csr.STREAM_THRESHOLD = original
+        self.assertTrue(changed)
+        self.assertEqual(
+            json.loads(self.json_file.read_text())['units'][0]['cost'], 12.5)
+
+    def test_failed_stream_removes_tmp_file(self):
+        self._write_faction([{'name': 'Rifles', 'specialRules': [{'name': 'Smoke'}]}])
+        original = csr.convert_unit_rules
+        csr.convert_unit_rules = lambda unit: (_ for _ in ()).throw(RuntimeError('boom'))
+        try:
+            with self.assertRaises(RuntimeError):
+                csr.stream_convert_file(self.json_file)
+        finally:
+            csr.convert_unit_rules = original
+        self.assertFalse(self.json_file.with_suffix('.json.tmp').exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -14,31 +14,140 @@ Examples:
 import json
 import re
 import sys
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.error import HTTPError
 from urllib.request import urlopen
 
+# urllib3 keeps keepalive connections between fetches, so batch runs
+# over several libraries skip the per-URL TLS handshake
+try:
+    import urllib3
+except ImportError:
+    urllib3 = None
+
+_pool = None
+
+# orjson parses JSON several times faster than stdlib json and returns
+# the same dict/list structures; fall back if it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Compiled once at import - these run per weapon/stat across thousands
+# of entries, so skip the re-cache lookup on every call
+_NUM_PLUS_RE = re.compile(r'(\d+)\+')
+_STAT_PREFIX_RE = re.compile(r'[A-Z](\d+)')
+# Unit-id normalization: spaces to hyphens, quotes dropped, one pass
+_ID_TRANS = str.maketrans({' ': '-', '"': '', "'": ''})
+
+# Sub-type to unit-class tables, checked in priority order
+_VEHICLE_SUB = (('Wheeled', 'Vec (W)'), ('Watercraft', 'Vec (W)'), ('Carriage', 'Vec (C)'))
+_AIRCRAFT_SUB = (('CAS', 'Air (CAS)'), ('CAP', 'Air (CAP)'))
+
+# unitClass values are a small closed set, so category assignment is a
+# dict lookup rather than a startswith chain
+_CLASS_TO_CATEGORY = {
+    'Inf': 'Infantry',
+    'Inf(S)': 'Infantry',
+    'Vec': 'Vehicles',
+    'Vec (W)': 'Vehicles',
+    'Vec (C)': 'Vehicles',
+    'Air': 'Aircraft',
+    'Air (CAS)': 'Aircraft',
+    'Air (CAP)': 'Aircraft',
+}
+
 def fetch_library(url):
     """Fetch the library JavaScript file from URL."""
     print(f"Fetching {url}...")
+    if urllib3 is not None:
+        global _pool
+        if _pool is None:
+            _pool = urllib3.PoolManager(
+                num_pools=4, maxsize=4,
+                retries=urllib3.Retry(total=3, status_forcelist=(500, 502, 503, 504)))
+        response = _pool.request('GET', url)
+        if response.status >= 400:
+            # Mirror urlopen, which raises for error responses instead
+            # of handing the HTML error page to the parser
+            raise HTTPError(url, response.status, response.reason,
+                            response.headers, None)
+        return response.data.decode('utf-8')
     with urlopen(url) as response:
         return response.read().decode('utf-8')
 
+def _strip_trailing_commas(text):
+    """Remove JS trailing commas (a ',' before a closing '}' or ']').
+
+    Single pass with double-quote string tracking, so commas inside
+    values are never touched (the source uses JSON-style strings).
+    """
+    out = []
+    append = out.append
+    in_string = False
+    escaped = False
+    n = len(text)
+    i = 0
+    while i < n:
+        ch = text[i]
+        if in_string:
+            append(ch)
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+            append(ch)
+        elif ch == ',':
+            # Peek past whitespace: skip the comma if a closer follows
+            j = i + 1
+            while j < n and text[j] in ' \t\r\n':
+                j += 1
+            if not (j < n and text[j] in '}]'):
+                append(ch)
+        else:
+            append(ch)
+        i += 1
+    return ''.join(out)
+
 def parse_js_to_json(js_content):
     """Parse JavaScript array export to Python dict."""
     # Extract the array content between const <name>list = [ and export
     # Try different list names: fedlist, luparlist, rygoliclist, santagrilist
-    match = re.search(r'const \w+list = (\[.*?\n\])\s*export', js_content, re.DOTALL)
-    if not match:
+    # str.find scan instead of a DOTALL .*? regex over the whole file
+    decl = js_content.find('list = [')
+    if decl == -1:
         raise ValueError("Could not find list array in JavaScript file")
-
-    array_content = match.group(1)
+    start = js_content.index('[', decl)
+
+    # The array closes at the first line-initial ']' followed only by
+    # whitespace before the export statement (same anchor the old regex
+    # pattern used)
+    n = len(js_content)
+    search_from = start
+    while True:
+        close = js_content.find('\n]', search_from)
+        if close == -1:
+            raise ValueError("Could not find list array in JavaScript file")
+        k = close + 2
+        while k < n and js_content[k].isspace():
+            k += 1
+        if js_content.startswith('export', k):
+            break
+        search_from = close + 1
+    array_content = js_content[start:close + 2]
 
     # Remove trailing commas that are valid in JS but not JSON
-    # Remove comma before closing } or ]
-    array_content = re.sub(r',(\s*[}\]])', r'\1', array_content)
+    array_content = _strip_trailing_commas(array_content)
 
     # The file already uses JSON format with quoted keys
-    # Parse as JSON
+    if orjson is not None:
+        return orjson.loads(array_content)
     return json.loads(array_content)
 
 def transform_unit_type(type_obj):
@@ -50,41 +159,45 @@ def transform_unit_type(type_obj):
     # Get the first super type (or empty string if none)
     super_type = super_types[0] if super_types else ''
 
-    # Check if 'Squad' is in the sub types
-    is_squad = 'Squad' in sub_types
+    # One set build per unit; every sub-type test below is O(1)
+    subs = frozenset(sub_types)
 
     # Map to schema unit classes
     if super_type == 'Infantry':
-        if is_squad:
-            return 'Inf(S)'
-        return 'Inf'
+        return 'Inf(S)' if 'Squad' in subs else 'Inf'
     elif super_type == 'Vehicle':
-        # Check for specific vehicle subtypes
-        if 'Wheeled' in sub_types or 'Watercraft' in sub_types:
-            return 'Vec (W)'
-        elif 'Carriage' in sub_types:
-            return 'Vec (C)'
         # Tracked, Hovercraft, Strider remain as Vec
-        return 'Vec'
+        return next((cls for sub, cls in _VEHICLE_SUB if sub in subs), 'Vec')
     elif super_type == 'Helicopter':
         return 'Vec'  # Helicopters are vehicles in the schema
     elif super_type == 'Aircraft':
-        # Check for aircraft role subtypes
-        if 'CAS' in sub_types:
-            return 'Air (CAS)'
-        elif 'CAP' in sub_types:
-            return 'Air (CAP)'
-        return 'Air'
+        return next((cls for sub, cls in _AIRCRAFT_SUB if sub in subs), 'Air')
 
     return 'Vec'  # Default
 
+@lru_cache(maxsize=4096)
 def parse_weapon_stat(stat_str, prefix):
-    """Parse weapon stats like 'R8\"', 'A4+', 'S1', 'D2'."""
+    """Parse weapon stats like 'R8\"', 'A4+', 'S1', 'D2'.
+
+    Cached - the same stat strings repeat across every unit in a
+    library, and the returns are all immutable scalars.
+    """
     if not isinstance(stat_str, str):
         return stat_str
 
-    # Remove the prefix and quotes
-    stat_str = stat_str.replace(prefix, '').replace('"', '').strip()
+    # Remove the prefix and quotes - the prefix only ever sits at
+    # position 0, so slice it off instead of scanning the whole string
+    if stat_str[:1] == prefix:
+        stat_str = stat_str[1:]
+    if '"' in stat_str:
+        stat_str = stat_str.replace('"', '')
+    stat_str = stat_str.strip()
+
+    # Fast path: the overwhelmingly common case is a plain digit run
+    # ('8', '24', '2'), which none of the special-case branches below
+    # can match
+    if stat_str.isdigit():
+        return int(stat_str)
 
     # Handle empty strings
     if not stat_str:
@@ -100,7 +213,7 @@ def parse_weapon_stat(stat_str, prefix):
     # Handle values with + like '1+', '4+'
     if '+' in stat_str:
         # Check if it's just a number with + or special
-        match = re.match(r'(\d+)\+', stat_str)
+        match = _NUM_PLUS_RE.match(stat_str)
         if match:
             num = int(match.group(1))
             # For accuracy, single digit means die roll (4+ = 4)
@@ -133,8 +246,10 @@ def transform_accuracy(attack):
     if not acc:
         return 4  # Default
 
-    # Remove the 'A' prefix
-    acc = acc.replace('A', '').strip()
+    # Remove the 'A' prefix (only ever at position 0)
+    if acc[:1] == 'A':
+        acc = acc[1:]
+    acc = acc.strip()
 
     # Check if it has / separator for stationary/moving
     if '/' in acc:
@@ -155,8 +270,10 @@ def transform_strength(attack):
     if not strength:
         return 0  # Default
 
-    # Remove the 'S' prefix
-    strength = strength.replace('S', '').strip()
+    # Remove the 'S' prefix (only ever at position 0)
+    if strength[:1] == 'S':
+        strength = strength[1:]
+    strength = strength.strip()
 
     # Check if it has / separator for normal/half range
     if '/' in strength:
@@ -210,8 +327,16 @@ def transform_weapon(weapon):
         # Multiple attack types - use shotTypes
         # Use first attack for common properties
         first_attack = attacks[0]
-        weapon_obj["target"] = first_attack.get('attackTargets', 'All')
-        weapon_obj["range"] = parse_weapon_stat(first_attack.get('attackRange', 'R0'), 'R')
+        common_target = first_attack.get('attackTargets', 'All')
+        common_range = parse_weapon_stat(first_attack.get('attackRange', 'R0'), 'R')
+        weapon_obj["target"] = common_target
+        weapon_obj["range"] = common_range
+
+        # Bind the helpers to locals for the per-shot loop - LOAD_FAST
+        # instead of a global lookup per call
+        pws = parse_weapon_stat
+        ta = transform_accuracy
+        ts = transform_strength
 
         shot_types = []
         for attack in attacks:
@@ -221,16 +346,16 @@ def transform_weapon(weapon):
 
             # Only include if different from common properties
             attack_target = attack.get('attackTargets')
-            if attack_target != weapon_obj["target"]:
+            if attack_target != common_target:
                 shot["target"] = attack_target
 
-            attack_range = parse_weapon_stat(attack.get('attackRange', 'R0'), 'R')
-            if attack_range != weapon_obj["range"]:
+            attack_range = pws(attack.get('attackRange', 'R0'), 'R')
+            if attack_range != common_range:
                 shot["range"] = attack_range
 
-            shot["accuracy"] = transform_accuracy(attack)
-            shot["strength"] = transform_strength(attack)
-            shot["dice"] = parse_weapon_stat(attack.get('attackDice', 'D1'), 'D')
+            shot["accuracy"] = ta(attack)
+            shot["strength"] = ts(attack)
+            shot["dice"] = pws(attack.get('attackDice', 'D1'), 'D')
 
             tags = attack.get('attackTags', [])
             if tags:
@@ -242,8 +367,12 @@ def transform_weapon(weapon):
 
     return weapon_obj
 
+@lru_cache(maxsize=4096)
 def parse_stat_value(stat_str):
-    """Parse a stat string like 'H2', 'M8\"', 'Q3' to extract the numeric value."""
+    """Parse a stat string like 'H2', 'M8\"', 'Q3' to extract the numeric value.
+
+    Cached for the same reason as parse_weapon_stat.
+    """
     if not isinstance(stat_str, str):
         return stat_str
 
@@ -251,8 +380,13 @@ def parse_stat_value(stat_str):
     if '*' in stat_str:
         return '*'
 
-    # Remove the prefix letter and any quotes
-    match = re.search(r'[A-Z](\d+)', stat_str)
+    # Fast path for the common '<LETTER><digits>' shape ('H2', 'Q3')
+    if 'A' <= stat_str[:1] <= 'Z' and stat_str[1:].isdigit():
+        return int(stat_str[1:])
+
+    # Remove the prefix letter and any quotes - the prefix anchors at
+    # position 0, so match instead of search
+    match = _STAT_PREFIX_RE.match(stat_str)
     if match:
         return int(match.group(1))
 
@@ -263,6 +397,16 @@ def parse_stat_value(stat_str):
     # If we can't parse it, return 1 as a safe default (not 0 which is invalid)
     return 1
 
+def _maybe_int(s):
+    """int(s) when it parses, otherwise the string unchanged.
+
+    One scan on the all-digit fast path instead of isdigit() + int().
+    """
+    try:
+        return int(s)
+    except ValueError:
+        return s
+
 def transform_toughness(stats_array):
     """Transform toughness from stats array."""
     # Stats array: [Height, Spotting, Movement, Quality, Toughness, Command]
@@ -279,13 +423,13 @@ def transform_toughness(stats_array):
         if '/' in tough:
             parts = tough.split('/')
             return {
-                "front": int(parts[0]) if parts[0].isdigit() else parts[0],
-                "side": int(parts[1]) if parts[1].isdigit() else parts[1],
-                "rear": int(parts[2]) if parts[2].isdigit() else parts[2]
+                "front": _maybe_int(parts[0]),
+                "side": _maybe_int(parts[1]),
+                "rear": _maybe_int(parts[2])
             }
         else:
             # Single value - might be aircraft
-            return int(tough) if tough.isdigit() else tough
+            return _maybe_int(tough)
     elif isinstance(tough, int):
         return tough
 
@@ -296,7 +440,7 @@ def transform_unit(unit):
     stats_array = unit.get('stats', [])
 
     # Create ID from name
-    unit_id = unit.get('name', 'unknown').lower().replace(' ', '-').replace('"', '').replace("'", '')
+    unit_id = unit.get('name', 'unknown').lower().translate(_ID_TRANS)
 
     # Parse stats with proper handling of special values
     height = parse_stat_value(stats_array[0]) if len(stats_array) > 0 else 1
@@ -315,27 +459,32 @@ def transform_unit(unit):
     if command == '*':
         command = 0
 
-    transformed = OrderedDict([
-        ('id', unit_id),
-        ('name', unit.get('name', 'Unknown Unit').upper()),
-        ('category', 'Infantry'),  # Will need to be categorized manually or by type
-        ('descriptiveCategory', ''),  # Will need to be filled in manually
-        ('points', unit.get('value', 0)),
-        ('stats', OrderedDict([
-            ('unitClass', transform_unit_type(unit.get('type', {}))),
-            ('height', height),
-            ('spottingDistance', spotting),
-            ('movement', movement),
-            ('quality', quality),
-            ('toughness', transform_toughness(stats_array)),
-            ('command', command)
-        ]))
-    ])
+    unit_class = transform_unit_type(unit.get('type', {}))
+
+    # Plain dicts preserve insertion order since 3.7, so the field
+    # order survives without OrderedDict's per-key link nodes
+    transformed = {
+        'id': unit_id,
+        'name': unit.get('name', 'Unknown Unit').upper(),
+        'category': _CLASS_TO_CATEGORY.get(unit_class, 'Infantry'),
+        'descriptiveCategory': '',  # Will need to be filled in manually
+        'points': unit.get('value', 0),
+        'stats': {
+            'unitClass': unit_class,
+            'height': height,
+            'spottingDistance': spotting,
+            'movement': movement,
+            'quality': quality,
+            'toughness': transform_toughness(stats_array),
+            'command': command,
+        },
+    }
 
     # Special rules and unit ability from tags
     tags = unit.get('tags', [])
     if tags:
         special_rules = []
+        append_rule = special_rules.append  # skip attribute lookup per tag
         unit_ability = None
 
         for tag in tags:
@@ -343,17 +492,25 @@ def transform_unit(unit):
             params = tag.get('params', '')
 
             # Check if this is a unit ability (long description-like text)
+            # (length compare first - cheaper than the endswith call)
             if len(rule_name) > 50 or rule_name.endswith('.'):
                 # This is a unit ability description
                 unit_ability = rule_name
             else:
                 # This is a special rule
                 # If it has params, append them to the name (e.g., "Brigade (2, 8\")")
+                # Plain concatenation - no format-spec parsing
                 if params:
-                    full_name = f"{rule_name} ({params})"
+                    full_name = rule_name + ' (' + params + ')'
                 else:
                     full_name = rule_name
-                special_rules.append(full_name)
+                append_rule(full_name)
+
+                # TACOMS for command units (units with Brigade special
+                # rule) - decided here so no second pass over the units
+                # is needed after the transform
+                if rule_name.startswith('Brigade'):
+                    transformed['category'] = 'TACOMS'
 
         if special_rules:
             transformed['specialRules'] = special_rules
@@ -365,27 +522,7 @@ def transform_unit(unit):
     if weapons:
         transformed['weapons'] = [transform_weapon(w) for w in weapons]
 
-    return dict(transformed)
-
-def categorize_units(units):
-    """Attempt to categorize units based on their type."""
-    for unit in units:
-        # Access unitClass from the stats object correctly
-        stats = unit.get('stats', {})
-        unit_type = stats.get('unitClass', 'Vec')
-
-        # Basic categorization
-        if unit_type.startswith('Inf'):
-            unit['category'] = 'Infantry'
-        elif unit_type.startswith('Vec'):
-            unit['category'] = 'Vehicles'
-        elif unit_type.startswith('Air'):
-            unit['category'] = 'Aircraft'
-
-        # TACOMS for command units (units with Brigade special rule)
-        # Special rules are now strings, not objects
-        if any(sr.startswith('Brigade') for sr in unit.get('specialRules', [])):
-            unit['category'] = 'TACOMS'
+    return transformed
 
 def extract_faction_info(url):
     """Extract faction ID and name from the URL."""
@@ -413,64 +550,86 @@ def extract_faction_info(url):
         }
     }
 
-    # Extract library name from URL
-    match = re.search(r'/(\w+Library)\.js', url)
-    if not match:
+    # Extract library name from URL - plain suffix handling, no regex
+    filename = url.rsplit('/', 1)[-1]
+    if not filename.endswith('Library.js'):
         raise ValueError(f"Could not extract faction name from URL: {url}")
 
-    library_name = match.group(1)
-    if library_name not in faction_map:
+    library_name = filename[:-3]  # strip '.js'
+    info = faction_map.get(library_name)
+    if info is None:
         raise ValueError(f"Unknown library: {library_name}")
 
-    return faction_map[library_name]
+    return info
+
+def transform_and_write(url, js_content):
+    """Transform one fetched library and write its faction file."""
+    faction_info = extract_faction_info(url)
+    units = parse_js_to_json(js_content)
+
+    print(f"Parsed {len(units)} units from {faction_info['name']}")
+
+    # Transform each unit (transform_unit also assigns the category)
+    transformed_units = [transform_unit(unit) for unit in units]
+
+    # Create the output structure
+    output = {
+        "faction": {
+            "id": faction_info['id'],
+            "name": faction_info['name'],
+            "description": faction_info['description'],
+            "version": "Imported from firelock-198X-armybuilder"
+        },
+        "units": transformed_units
+    }
+
+    # Write to output file - capitalize first letter for filename
+    filename = faction_info['name'].split()[0] if ' ' in faction_info['name'] else faction_info['name']
+    output_path = f"../src/data/factions/{filename}.json"
+    # orjson serializes the tree at C level into one buffer; json.dump
+    # recurses in Python and issues one small write per token. Either
+    # way the payload is pre-encoded bytes pushed through one binary
+    # write with a 1 MiB buffer - no TextIOWrapper codec pass
+    if orjson is not None:
+        payload = orjson.dumps(output, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(output, indent=2, ensure_ascii=False).encode('utf-8')
+    with open(output_path, 'wb', buffering=1 << 20) as f:
+        f.write(payload)
+
+    print(f"\n✓ Successfully transformed {len(transformed_units)} units")
+    print(f"✓ Written to {output_path}")
 
 def main():
     """Main transformation function."""
     try:
         # Check for URL argument
         if len(sys.argv) < 2:
-            print("Usage: python transform_federal_library.py <url>", file=sys.stderr)
+            print("Usage: python transform_federal_library.py <url> [<url> ...]", file=sys.stderr)
             print("\nExamples:", file=sys.stderr)
             print("  python transform_federal_library.py https://raw.githubusercontent.com/nullAurelian/firelock-198X-armybuilder/refs/heads/main/src/data/federalLibrary.js", file=sys.stderr)
             print("  python transform_federal_library.py https://raw.githubusercontent.com/nullAurelian/firelock-198X-armybuilder/refs/heads/main/src/data/luparLibrary.js", file=sys.stderr)
             sys.exit(1)
 
-        url = sys.argv[1]
-
-        # Extract faction info from URL
-        faction_info = extract_faction_info(url)
-
-        # Fetch and parse source data
-        js_content = fetch_library(url)
-        units = parse_js_to_json(js_content)
+        urls = sys.argv[1:]
 
-        print(f"Parsed {len(units)} units from {faction_info['name']}")
+        # Validate the faction mapping up front so a bad URL fails
+        # before any network work
+        for url in urls:
+            extract_faction_info(url)
 
-        # Transform each unit
-        transformed_units = [transform_unit(unit) for unit in units]
-
-        # Categorize units
-        categorize_units(transformed_units)
-
-        # Create the output structure
-        output = {
-            "faction": {
-                "id": faction_info['id'],
-                "name": faction_info['name'],
-                "description": faction_info['description'],
-                "version": "Imported from firelock-198X-armybuilder"
-            },
-            "units": transformed_units
-        }
+        # Fetch all libraries concurrently - the fetches are pure I/O,
+        # so threads overlap the latency while sharing the keepalive
+        # pool; the transform itself stays serial (it's CPU-light)
+        if len(urls) == 1:
+            contents = [fetch_library(urls[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+                contents = list(executor.map(fetch_library, urls))
 
-        # Write to output file - capitalize first letter for filename
-        filename = faction_info['name'].split()[0] if ' ' in faction_info['name'] else faction_info['name']
-        output_path = f"../src/data/factions/{filename}.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        for url, js_content in zip(urls, contents):
+            transform_and_write(url, js_content)
 
-        print(f"\n✓ Successfully transformed {len(transformed_units)} units")
-        print(f"✓ Written to {output_path}")
         print("\nNote: You may need to manually adjust:")
         print("  - Category assignments")
         print("  - Descriptive categories")